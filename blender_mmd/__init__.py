@@ -16,25 +16,39 @@ def _restore_morph_sync_handler(*_args):
             return
 
 
+def _cache_handler_lists():
+    """App handler lists that invalidate helpers' lookup caches."""
+    import bpy
+    h = bpy.app.handlers
+    return (h.depsgraph_update_post, h.undo_post, h.redo_post, h.load_post)
+
+
 def register():
     import bpy
     from . import materials, operators, outlines, panels
+    from .helpers import clear_file_caches, clear_lookup_caches
     materials.register()
     outlines.register()
     operators.register()
     panels.register()
     bpy.app.handlers.load_post.append(_restore_morph_sync_handler)
+    bpy.app.handlers.load_post.append(clear_file_caches)
+    for handlers in _cache_handler_lists():
+        handlers.append(clear_lookup_caches)
     log.info("Blender MMD registered")
 
 
 def unregister():
     import bpy
     from . import materials, operators, outlines, panels
+    from .helpers import clear_file_caches, clear_lookup_caches
     from .mesh import _remove_morph_sync_handler
     _remove_morph_sync_handler()
+    for handlers in _cache_handler_lists():
+        handlers[:] = [h for h in handlers if h is not clear_lookup_caches]
     bpy.app.handlers.load_post[:] = [
         h for h in bpy.app.handlers.load_post
-        if h is not _restore_morph_sync_handler
+        if h is not _restore_morph_sync_handler and h is not clear_file_caches
     ]
     panels.unregister()
     operators.unregister()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 import bpy
 
 
@@ -19,6 +21,43 @@ def is_mmd_armature(obj) -> bool:
     )
 
 
+def get_import_scale(armature_obj) -> float:
+    """Return the import scale stored on an MMD armature."""
+    # Same default as importer.DEFAULT_SCALE
+    return armature_obj.get("import_scale", 0.08)
+
+
+# Result of the scene scan in find_mmd_armature, keyed by scene pointer:
+# the armature name, or None when the scene has zero or several candidates.
+_scene_armature_cache: dict[int, str | None] = {}
+
+# IK constraints per armature pointer as (owner_bone, constraint_name,
+# subtarget), sorted by subtarget. Names only — RNA references can dangle.
+_ik_constraint_cache: dict[int, list[tuple[str, str, str]]] = {}
+
+# SDEF vertex count per mesh object pointer as (vertex_count, sdef_count).
+_sdef_count_cache: dict[int, tuple[int, int]] = {}
+
+
+@bpy.app.handlers.persistent
+def clear_lookup_caches(*_args) -> None:
+    """Drop cached scene lookups. Registered on depsgraph update, undo/redo and load."""
+    _scene_armature_cache.clear()
+    _ik_constraint_cache.clear()
+    _sdef_count_cache.clear()
+
+
+@bpy.app.handlers.persistent
+def clear_file_caches(*_args) -> None:
+    """Drop caches that validate their own entries. Registered on load only.
+
+    _json_cache checks the raw string on every hit, so clearing it per
+    depsgraph update would only force re-parsing; after a file load its
+    pointer keys belong to objects that no longer exist.
+    """
+    _json_cache.clear()
+
+
 def find_mmd_armature(context) -> bpy.types.Object | None:
     """Find the relevant MMD armature from context.
 
@@ -30,9 +69,104 @@ def find_mmd_armature(context) -> bpy.types.Object | None:
             return obj
         if obj.parent and is_mmd_armature(obj.parent):
             return obj.parent
-    # Auto-detect: single MMD armature in scene
-    candidates = [o for o in context.scene.objects if is_mmd_armature(o)]
-    return candidates[0] if len(candidates) == 1 else None
+    # Auto-detect: single MMD armature in scene. The scan result is cached
+    # between depsgraph updates since panels call this on every redraw.
+    scene = context.scene
+    key = scene.as_pointer()
+    if key in _scene_armature_cache:
+        name = _scene_armature_cache[key]
+        if name is None:
+            return None
+        obj = scene.objects.get(name)
+        if is_mmd_armature(obj):
+            return obj
+    found = None
+    for o in scene.objects:
+        if is_mmd_armature(o):
+            if found is not None:
+                found = None  # ambiguous — more than one MMD armature
+                break
+            found = o
+    _scene_armature_cache[key] = found.name if found else None
+    return found
+
+
+def get_ik_constraints(armature_obj) -> list[tuple[str, str, str]]:
+    """Return (owner_bone, constraint_name, subtarget) for IK constraints with a valid target.
+
+    Cached until the next depsgraph update; read constraint state live.
+    """
+    key = armature_obj.as_pointer()
+    entries = _ik_constraint_cache.get(key)
+    if entries is None:
+        bones = armature_obj.data.bones
+        entries = [
+            (pb.name, c.name, c.subtarget)
+            for pb in armature_obj.pose.bones
+            for c in pb.constraints
+            if c.type == "IK" and c.subtarget and bones.get(c.subtarget)
+        ]
+        entries.sort(key=lambda e: e[2])
+        _ik_constraint_cache[key] = entries
+    return entries
+
+
+# Parsed JSON metadata, keyed by (armature pointer, ID prop name).
+# Each entry keeps the raw string it was parsed from so edits to the
+# property (rebuild, chain removal, undo) are picked up automatically.
+_json_cache: dict[tuple[int, str], tuple[str, object]] = {}
+
+
+def _load_cached_json(obj, key: str, default, convert=None):
+    """Return parsed JSON from an ID property, reusing the last parse.
+
+    ``convert`` is applied to the parsed value before caching. The returned
+    object is shared between callers — treat it as read-only.
+    """
+    raw = obj.get(key)
+    if not raw:
+        return default
+    cache_key = (obj.as_pointer(), key)
+    hit = _json_cache.get(cache_key)
+    if hit is not None and hit[0] == raw:
+        return hit[1]
+    parsed = json.loads(raw)
+    if convert is not None:
+        parsed = convert(parsed)
+    _json_cache[cache_key] = (raw, parsed)
+    return parsed
+
+
+def load_physics_chains(armature_obj) -> list[dict]:
+    """Return the stored physics chain list (cached, read-only)."""
+    return _load_cached_json(armature_obj, "mmd_physics_chains", [])
+
+
+def load_physics_data(armature_obj) -> dict:
+    """Return the stored rigid body/joint metadata (cached, read-only)."""
+    return _load_cached_json(armature_obj, "mmd_physics_data", {})
+
+
+def load_collision_disabled(armature_obj) -> frozenset[str]:
+    """Return names of chains with collisions turned off (cached)."""
+    return _load_cached_json(
+        armature_obj, "mmd_chain_collision_disabled", frozenset(), frozenset,
+    )
+
+
+def load_physics_disabled(armature_obj) -> frozenset[str]:
+    """Return names of chains switched to kinematic mode (cached)."""
+    return _load_cached_json(
+        armature_obj, "mmd_chain_physics_disabled", frozenset(), frozenset,
+    )
+
+
+def get_physics_collection(armature_obj) -> bpy.types.Collection | None:
+    """Return the armature's physics collection, or None if not built."""
+    col_name = armature_obj.get("physics_collection")
+    if not col_name:
+        return None
+    return bpy.data.collections.get(col_name)
 
 
 def get_model_info(armature_name: str | None = None) -> dict:
@@ -120,7 +254,6 @@ def get_physics_mode(armature_name: str | None = None) -> str | None:
 
 def get_physics_chains(armature_name: str | None = None) -> list[dict] | None:
     """Return detected physics chains from armature metadata."""
-    import json
     obj = _get_armature(armature_name)
     if not obj:
         return None
@@ -177,10 +310,18 @@ def find_selected_mesh(context) -> bpy.types.Object | None:
 
 
 def get_mesh_sdef_count(mesh_obj) -> int:
-    """Count vertices in the mmd_sdef vertex group."""
+    """Count vertices in the mmd_sdef vertex group (cached until the next update).
+
+    Same criterion as the select_sdef_vertices operator: weight > 0.
+    """
     vg = mesh_obj.vertex_groups.get("mmd_sdef")
     if not vg:
         return 0
+    key = mesh_obj.as_pointer()
+    n_verts = len(mesh_obj.data.vertices)
+    hit = _sdef_count_cache.get(key)
+    if hit is not None and hit[0] == n_verts:
+        return hit[1]
     count = 0
     vg_idx = vg.index
     for v in mesh_obj.data.vertices:
@@ -188,6 +329,7 @@ def get_mesh_sdef_count(mesh_obj) -> int:
             if g.group == vg_idx and g.weight > 0:
                 count += 1
                 break
+    _sdef_count_cache[key] = (n_verts, count)
     return count
 
 
@@ -197,11 +339,9 @@ def get_mesh_physics_chains(mesh_obj, armature_obj) -> list[dict]:
     A chain affects a mesh if any of its rigid bodies are attached to
     bones that have non-empty vertex groups on the mesh.
     """
-    import json
-
-    chains_json = armature_obj.get("mmd_physics_chains")
-    phys_json = armature_obj.get("mmd_physics_data")
-    if not chains_json or not phys_json:
+    chains = load_physics_chains(armature_obj)
+    phys_data = load_physics_data(armature_obj)
+    if not chains or not phys_data:
         return []
 
     # Build set of bone names that have vertex groups on this mesh
@@ -222,13 +362,11 @@ def get_mesh_physics_chains(mesh_obj, armature_obj) -> list[dict]:
             bone_idx_to_name[idx] = bone.name
 
     # Build rigid_index → bone_index map from physics data
-    phys_data = json.loads(phys_json)
     rigid_to_bone_idx = {}
     for i, rb in enumerate(phys_data.get("rigid_bodies", [])):
         rigid_to_bone_idx[i] = rb.get("bone_index", -1)
 
     # Check each chain
-    chains = json.loads(chains_json)
     matching = []
     for chain in chains:
         for ri in chain.get("rigid_indices", []):
@@ -247,12 +385,14 @@ def select_bones_by_name(names: list[str]) -> int:
     if not obj or obj.type != "ARMATURE":
         return 0
 
+    import numpy as np
+
     bpy.ops.object.mode_set(mode="POSE")
-    bpy.ops.pose.select_all(action="DESELECT")
-    count = 0
-    for name in names:
-        pb = obj.pose.bones.get(name)
-        if pb:
-            pb.bone.select = True
-            count += 1
-    return count
+    # Write the whole selection state in one call — avoids a select_all
+    # operator dispatch and a per-bone RNA write.
+    wanted = set(names)
+    bones = obj.data.bones
+    mask = np.fromiter((b.name in wanted for b in bones), dtype=bool, count=len(bones))
+    bones.foreach_set("select", mask)
+    obj.data.update_tag()
+    return int(mask.sum())
@@ -144,6 +144,11 @@ def _setup_bone_collections(armature_obj, model) -> None:
         if bone_name and rb.mode in (RigidMode.DYNAMIC, RigidMode.DYNAMIC_BONE):
             dynamic_bones.add(bone_name)
 
+    # BoneCollection.bones is always empty in edit mode, so read the
+    # shadow bone membership before switching.
+    shadow_coll = arm_data.collections.get("mmd_shadow")
+    shadow_names = {b.name for b in shadow_coll.bones} if shadow_coll else set()
+
     bpy.context.view_layer.objects.active = armature_obj
     bpy.ops.object.mode_set(mode="EDIT")
 
@@ -154,10 +159,8 @@ def _setup_bone_collections(armature_obj, model) -> None:
     if not physics_coll:
         physics_coll = arm_data.collections.new("Physics")
 
-    shadow_coll = arm_data.collections.get("mmd_shadow")
-
     for ebone in arm_data.edit_bones:
-        if shadow_coll and shadow_coll in ebone.collections.values():
+        if ebone.name in shadow_names:
             continue
         if ebone.name in dynamic_bones:
             physics_coll.assign(ebone)
@@ -181,9 +184,9 @@ def _setup_bone_collections(armature_obj, model) -> None:
 
     log.info(
         "Bone collections: %d armature, %d physics, %d shadow",
-        len([b for b in arm_data.bones if armature_coll in b.collections.values()]),
+        len(armature_coll.bones),
         len(dynamic_bones),
-        len([b for b in arm_data.bones if shadow_coll and shadow_coll in b.collections.values()]),
+        len(shadow_names),
     )
 
 
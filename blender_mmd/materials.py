@@ -920,14 +920,18 @@ def _fix_overlapping_face_materials(mesh_data: "bpy.types.Mesh") -> None:
 
 def _on_emission_update(self, _context):
     """Called when mmd_emission changes on an armature object."""
-    if self.type == "ARMATURE" and self.get("import_scale") is not None:
+    from .helpers import is_mmd_armature
+
+    if is_mmd_armature(self):
         update_materials(self)
 
 
 def _on_emission_fac_update(self, context):
     """Called when mmd_emission_fac changes on a material."""
+    from .helpers import is_mmd_armature
+
     for obj in bpy.data.objects:
-        if obj.type != "ARMATURE" or obj.get("import_scale") is None:
+        if not is_mmd_armature(obj):
             continue
         for child in obj.children:
             if child.type != "MESH":
@@ -12,6 +12,7 @@ import math
 import numpy as np
 import bpy
 
+from .helpers import is_mmd_armature
 from .pmx.types import (
     BoneWeightBDEF1,
     BoneWeightBDEF2,
@@ -734,7 +735,7 @@ def _morph_sync_handler(scene: bpy.types.Scene) -> None:
     from .materials import update_materials
 
     for obj in scene.objects:
-        if obj.type != "ARMATURE" or obj.get("import_scale") is None:
+        if not is_mmd_armature(obj):
             continue
 
         # --- Material controls: sync toon_fac, sphere_fac, emission ---
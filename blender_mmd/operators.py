@@ -3,15 +3,33 @@
 from __future__ import annotations
 
 import logging
+import os
 
 import bpy
 from bpy.props import BoolProperty, EnumProperty, FloatProperty, FloatVectorProperty, IntProperty, StringProperty
 from bpy_extras.io_utils import ImportHelper
 
-from .helpers import find_mmd_armature
+from .helpers import (
+    find_mmd_armature,
+    find_selected_mesh,
+    get_import_scale,
+    get_mesh_physics_chains,
+    get_physics_collection,
+    load_collision_disabled,
+    load_physics_chains,
+    load_physics_data,
+    load_physics_disabled,
+)
 
 log = logging.getLogger("blender_mmd")
 
+# Shared by the build operator and the Scene property in panels.py
+NCC_MODE_ITEMS = (
+    ("draft", "Draft", "No NCCs. Fast preview, bodies pass through each other"),
+    ("proximity", "Proximity", "Distance-filtered NCCs. Faster builds, may miss distant collisions"),
+    ("all", "All", "Every excluded pair gets an NCC. Most correct, most objects"),
+)
+
 
 class BLENDER_MMD_OT_import_pmx(bpy.types.Operator, ImportHelper):
     """Import an MMD model file (PMX/PMD)"""
@@ -131,7 +149,7 @@ class BLENDER_MMD_OT_import_vmd(bpy.types.Operator, ImportHelper):
             )
             return {"CANCELLED"}
 
-        scale = armature_obj.get("import_scale", 0.08)
+        scale = get_import_scale(armature_obj)
         target_fps = self.fps_custom if self.fps_mode == "CUSTOM" else int(self.fps_mode)
 
         try:
@@ -156,6 +174,49 @@ class BLENDER_MMD_OT_import_vmd(bpy.types.Operator, ImportHelper):
             return {"CANCELLED"}
 
 
+def _reveal_physics_collection(context, armature_obj):
+    """Return the armature's physics collection, unhiding it in the viewport."""
+    collection = get_physics_collection(armature_obj)
+    if collection is None:
+        return None
+    vl_col = context.view_layer.layer_collection.children.get(collection.name)
+    if vl_col and vl_col.hide_viewport:
+        vl_col.hide_viewport = False
+    return collection
+
+
+# Last parsed model file: (filepath, mtime_ns, size, model). Rebuilding
+# physics (e.g. after changing NCC mode) reuses it instead of re-parsing.
+# Dropped on file load and when physics is cleared so the model does not
+# outlive the armature it was built for.
+_parsed_model = None
+
+
+@bpy.app.handlers.persistent
+def _clear_parsed_model(*_args) -> None:
+    """Release the cached parsed model. Registered on load_post."""
+    global _parsed_model
+    _parsed_model = None
+
+
+def _parse_model(filepath: str):
+    """Parse a PMX/PMD file, reusing the previous result if it is unchanged."""
+    global _parsed_model
+    st = os.stat(filepath)
+    if _parsed_model is not None:
+        path, mtime_ns, size, model = _parsed_model
+        if path == filepath and mtime_ns == st.st_mtime_ns and size == st.st_size:
+            return model
+
+    if filepath.lower().endswith(".pmd"):
+        from .pmd import parse
+    else:
+        from .pmx import parse
+    model = parse(filepath)
+    _parsed_model = (filepath, st.st_mtime_ns, st.st_size, model)
+    return model
+
+
 class BLENDER_MMD_OT_build_physics(bpy.types.Operator):
     """Build physics for an MMD model (modal with progress)"""
 
@@ -176,11 +237,7 @@ class BLENDER_MMD_OT_build_physics(bpy.types.Operator):
     ncc_mode: EnumProperty(
         name="NCC Mode",
         description="Non-collision constraint mode",
-        items=[
-            ("draft", "Draft", "No NCCs. Fast preview, bodies pass through each other"),
-            ("proximity", "Proximity", "Distance-filtered NCCs. Faster builds, may miss distant collisions"),
-            ("all", "All", "Every excluded pair gets an NCC. Most correct, most objects"),
-        ],
+        items=NCC_MODE_ITEMS,
         default="all",
     )
 
@@ -263,8 +320,6 @@ class BLENDER_MMD_OT_build_physics(bpy.types.Operator):
                 area.tag_redraw()
 
     def invoke(self, context, event):
-        from pathlib import Path
-
         armature_obj = find_mmd_armature(context)
         if armature_obj is None:
             self.report({"ERROR"}, "No MMD armature found.")
@@ -279,18 +334,12 @@ class BLENDER_MMD_OT_build_physics(bpy.types.Operator):
         if self.mode != "rigid_body":
             return self._execute_sync(context, armature_obj, filepath)
 
-        scale = armature_obj.get("import_scale", 0.08)
+        scale = get_import_scale(armature_obj)
 
         try:
-            ext = Path(filepath).suffix.lower()
-            if ext == ".pmd":
-                from .pmd import parse
-            else:
-                from .pmx import parse
-
             from .physics import build_physics_iter
 
-            model = parse(filepath)
+            model = _parse_model(filepath)
             self._model = model
             self._armature_name = armature_obj.name
             self._generator = build_physics_iter(
@@ -321,18 +370,11 @@ class BLENDER_MMD_OT_build_physics(bpy.types.Operator):
         return self._execute_sync(context, armature_obj, filepath)
 
     def _execute_sync(self, context, armature_obj, filepath):
-        from pathlib import Path
-
         from .physics import build_physics
 
-        scale = armature_obj.get("import_scale", 0.08)
+        scale = get_import_scale(armature_obj)
         try:
-            ext = Path(filepath).suffix.lower()
-            if ext == ".pmd":
-                from .pmd import parse
-            else:
-                from .pmx import parse
-            model = parse(filepath)
+            model = _parse_model(filepath)
             build_physics(
                 armature_obj, model, scale,
                 mode=self.mode,
@@ -447,6 +489,7 @@ class BLENDER_MMD_OT_clear_physics(bpy.types.Operator):
 
         try:
             clear_physics(armature_obj)
+            _clear_parsed_model()
             self.report({"INFO"}, "Physics cleared.")
             return {"FINISHED"}
         except Exception as e:
@@ -490,19 +533,16 @@ class BLENDER_MMD_OT_select_chain(bpy.types.Operator):
     chain_index: IntProperty(name="Chain Index", default=-1)
 
     def execute(self, context):
-        import json
-
         armature_obj = find_mmd_armature(context)
         if armature_obj is None:
             self.report({"ERROR"}, "No MMD armature found.")
             return {"CANCELLED"}
 
-        chains_json = armature_obj.get("mmd_physics_chains")
-        if not chains_json:
+        chains = load_physics_chains(armature_obj)
+        if not chains:
             self.report({"ERROR"}, "No chain data.")
             return {"CANCELLED"}
 
-        chains = json.loads(chains_json)
         if self.chain_index < 0 or self.chain_index >= len(chains):
             self.report({"ERROR"}, "Invalid chain index.")
             return {"CANCELLED"}
@@ -510,17 +550,9 @@ class BLENDER_MMD_OT_select_chain(bpy.types.Operator):
         chain = chains[self.chain_index]
         rigid_indices = set(chain.get("rigid_indices", []))
 
-        col_name = armature_obj.get("physics_collection")
-        if not col_name:
+        collection = _reveal_physics_collection(context, armature_obj)
+        if collection is None:
             return {"CANCELLED"}
-        collection = bpy.data.collections.get(col_name)
-        if not collection:
-            return {"CANCELLED"}
-
-        # Unhide physics collection so selection is visible
-        vl_col = context.view_layer.layer_collection.children.get(col_name)
-        if vl_col and vl_col.hide_viewport:
-            vl_col.hide_viewport = False
 
         # Deselect all, then select chain rigid bodies
         bpy.ops.object.select_all(action="DESELECT")
@@ -743,18 +775,10 @@ class BLENDER_MMD_OT_select_colliders(bpy.types.Operator):
         idx = obj["mmd_rigid_index"]
         eligible = get_collision_eligible_indices(armature_obj, idx)
 
-        col_name = armature_obj.get("physics_collection")
-        if not col_name:
-            return {"CANCELLED"}
-        col = bpy.data.collections.get(col_name)
-        if not col:
+        col = _reveal_physics_collection(context, armature_obj)
+        if col is None:
             return {"CANCELLED"}
 
-        # Unhide physics collection
-        vl_col = context.view_layer.layer_collection.children.get(col_name)
-        if vl_col and vl_col.hide_viewport:
-            vl_col.hide_viewport = False
-
         bpy.ops.object.select_all(action="DESELECT")
         rb_col = col.children.get("Rigid Bodies")
         count = 0
@@ -796,18 +820,10 @@ class BLENDER_MMD_OT_select_contacts(bpy.types.Operator):
         idx = obj["mmd_rigid_index"]
         eligible = get_collision_eligible_indices(armature_obj, idx)
 
-        col_name = armature_obj.get("physics_collection")
-        if not col_name:
-            return {"CANCELLED"}
-        col = bpy.data.collections.get(col_name)
-        if not col:
+        col = _reveal_physics_collection(context, armature_obj)
+        if col is None:
             return {"CANCELLED"}
 
-        # Unhide physics collection
-        vl_col = context.view_layer.layer_collection.children.get(col_name)
-        if vl_col and vl_col.hide_viewport:
-            vl_col.hide_viewport = False
-
         # Find contacts using bounding box overlap
         rb_col = col.children.get("Rigid Bodies")
         if not rb_col:
@@ -821,10 +837,8 @@ class BLENDER_MMD_OT_select_contacts(bpy.types.Operator):
                 eligible_objs[rb_idx] = rb_obj
 
         # Shape-aware contact detection using collision shape radii
-        import json
-        phys_data = json.loads(armature_obj["mmd_physics_data"])
-        rbs_data = phys_data["rigid_bodies"]
-        import_scale = armature_obj.get("import_scale", 0.08)
+        rbs_data = load_physics_data(armature_obj)["rigid_bodies"]
+        import_scale = get_import_scale(armature_obj)
         margin = 0.005  # small contact threshold
 
         bpy.ops.object.select_all(action="DESELECT")
@@ -895,42 +909,44 @@ class BLENDER_MMD_OT_select_sdef_vertices(bpy.types.Operator):
             self.report({"ERROR"}, "No mesh with SDEF vertices found.")
             return {"CANCELLED"}
 
-        # Select mesh, enter edit mode
-        bpy.ops.object.mode_set(mode="OBJECT")
-        bpy.ops.object.select_all(action="DESELECT")
-        mesh_obj.select_set(True)
-        context.view_layer.objects.active = mesh_obj
-        bpy.ops.object.mode_set(mode="EDIT")
-
-        bm = bmesh.from_edit_mesh(mesh_obj.data)
-
-        # Find SDEF group index
         vg_sdef = mesh_obj.vertex_groups.get("mmd_sdef")
         if vg_sdef is None:
-            bpy.ops.object.mode_set(mode="OBJECT")
             self.report({"ERROR"}, "No mmd_sdef vertex group.")
             return {"CANCELLED"}
 
-        deform_layer = bm.verts.layers.deform.active
-        if deform_layer is None:
+        mesh = mesh_obj.data
+
+        # Already editing this mesh: select through the bmesh deform layer
+        # directly instead of an OBJECT/EDIT round-trip.
+        if not (mesh_obj.mode == "EDIT" and context.active_object == mesh_obj):
+            if context.mode != "OBJECT":
+                bpy.ops.object.mode_set(mode="OBJECT")
+            bpy.ops.object.select_all(action="DESELECT")
+            mesh_obj.select_set(True)
+            context.view_layer.objects.active = mesh_obj
+            bpy.ops.object.mode_set(mode="EDIT")
+
+        bm = bmesh.from_edit_mesh(mesh)
+        deform = bm.verts.layers.deform.active
+        if deform is None:
             bpy.ops.object.mode_set(mode="OBJECT")
             self.report({"ERROR"}, "No deform layer.")
             return {"CANCELLED"}
 
-        # Deselect all, then select SDEF verts
-        bm.select_flush(False)
-        for v in bm.verts:
-            v.select = False
+        # Deselect all, then select vertices in mmd_sdef with weight > 0
+        # (same criterion as helpers.get_mesh_sdef_count)
+        for f in bm.faces:
+            f.select = False
+        for e in bm.edges:
+            e.select = False
         count = 0
         gi = vg_sdef.index
         for v in bm.verts:
-            dvert = v[deform_layer]
-            if gi in dvert:
-                v.select = True
-                count += 1
+            v.select = v[deform].get(gi, 0.0) > 0
+            count += v.select
 
         bm.select_flush(True)
-        bmesh.update_edit_mesh(mesh_obj.data)
+        bmesh.update_edit_mesh(mesh, loop_triangles=False, destructive=False)
 
         self.report({"INFO"}, f"Selected {count} SDEF vertices on {mesh_obj.name}")
         return {"FINISHED"}
@@ -1179,7 +1195,6 @@ class BLENDER_MMD_OT_toggle_mesh_outline(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        from .helpers import find_selected_mesh
         mesh_obj = find_selected_mesh(context)
         if not mesh_obj:
             return False
@@ -1187,7 +1202,6 @@ class BLENDER_MMD_OT_toggle_mesh_outline(bpy.types.Operator):
         return mat is not None and mat.get("mmd_edge_enabled", False)
 
     def execute(self, context):
-        from .helpers import find_selected_mesh
         from .outlines import toggle_mesh_outline
 
         mesh_obj = find_selected_mesh(context)
@@ -1219,11 +1233,9 @@ class BLENDER_MMD_OT_set_mesh_edge_color(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        from .helpers import find_selected_mesh
         return find_selected_mesh(context) is not None
 
     def execute(self, context):
-        from .helpers import find_selected_mesh
         from .outlines import set_mesh_edge_color
 
         mesh_obj = find_selected_mesh(context)
@@ -1270,7 +1282,6 @@ class BLENDER_MMD_OT_toggle_chain_collisions(bpy.types.Operator):
     chain_index: IntProperty(name="Chain Index", default=-1)
 
     def execute(self, context):
-        import json
         from .physics import toggle_chain_collisions
 
         armature_obj = find_mmd_armature(context)
@@ -1279,14 +1290,13 @@ class BLENDER_MMD_OT_toggle_chain_collisions(bpy.types.Operator):
             return {"CANCELLED"}
 
         # Determine current state to toggle
-        chains = json.loads(armature_obj.get("mmd_physics_chains", "[]"))
+        chains = load_physics_chains(armature_obj)
         if self.chain_index < 0 or self.chain_index >= len(chains):
             self.report({"ERROR"}, "Invalid chain index.")
             return {"CANCELLED"}
 
         chain_name = chains[self.chain_index]["name"]
-        disabled = set(json.loads(armature_obj.get("mmd_chain_collision_disabled", "[]")))
-        enable = chain_name in disabled  # if currently disabled, enable
+        enable = chain_name in load_collision_disabled(armature_obj)  # if currently disabled, enable
 
         try:
             toggle_chain_collisions(armature_obj, self.chain_index, enable)
@@ -1309,7 +1319,6 @@ class BLENDER_MMD_OT_toggle_chain_physics(bpy.types.Operator):
     chain_index: IntProperty(name="Chain Index", default=-1)
 
     def execute(self, context):
-        import json
         from .physics import toggle_chain_physics
 
         armature_obj = find_mmd_armature(context)
@@ -1317,14 +1326,13 @@ class BLENDER_MMD_OT_toggle_chain_physics(bpy.types.Operator):
             self.report({"ERROR"}, "No MMD armature found.")
             return {"CANCELLED"}
 
-        chains = json.loads(armature_obj.get("mmd_physics_chains", "[]"))
+        chains = load_physics_chains(armature_obj)
         if self.chain_index < 0 or self.chain_index >= len(chains):
             self.report({"ERROR"}, "Invalid chain index.")
             return {"CANCELLED"}
 
         chain_name = chains[self.chain_index]["name"]
-        disabled = set(json.loads(armature_obj.get("mmd_chain_physics_disabled", "[]")))
-        enable = chain_name in disabled  # if currently disabled, enable
+        enable = chain_name in load_physics_disabled(armature_obj)  # if currently disabled, enable
 
         try:
             toggle_chain_physics(armature_obj, self.chain_index, enable)
@@ -1346,12 +1354,9 @@ class BLENDER_MMD_OT_select_mesh_rigid_bodies(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        from .helpers import find_selected_mesh
         return find_selected_mesh(context) is not None
 
     def execute(self, context):
-        from .helpers import find_selected_mesh, get_mesh_physics_chains
-
         mesh_obj = find_selected_mesh(context)
         if mesh_obj is None:
             self.report({"ERROR"}, "No MMD mesh selected.")
@@ -1368,17 +1373,9 @@ class BLENDER_MMD_OT_select_mesh_rigid_bodies(bpy.types.Operator):
         for chain in chains:
             rigid_indices.update(chain.get("rigid_indices", []))
 
-        col_name = armature_obj.get("physics_collection")
-        if not col_name:
+        collection = _reveal_physics_collection(context, armature_obj)
+        if collection is None:
             return {"CANCELLED"}
-        collection = bpy.data.collections.get(col_name)
-        if not collection:
-            return {"CANCELLED"}
-
-        # Unhide physics collection
-        vl_col = context.view_layer.layer_collection.children.get(col_name)
-        if vl_col and vl_col.hide_viewport:
-            vl_col.hide_viewport = False
 
         bpy.ops.object.select_all(action="DESELECT")
         rb_col = collection.children.get("Rigid Bodies")
@@ -1405,11 +1402,9 @@ class BLENDER_MMD_OT_delete_mesh(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        from .helpers import find_selected_mesh
         return find_selected_mesh(context) is not None
 
     def execute(self, context):
-        from .helpers import find_selected_mesh
         mesh_obj = find_selected_mesh(context)
         if mesh_obj is None:
             self.report({"ERROR"}, "No MMD mesh selected.")
@@ -1588,13 +1583,19 @@ _classes = (
 )
 
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(_classes)
+
+
 def register():
-    for cls in _classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
     bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
+    bpy.app.handlers.load_post.append(_clear_parsed_model)
 
 
 def unregister():
+    bpy.app.handlers.load_post[:] = [
+        h for h in bpy.app.handlers.load_post if h is not _clear_parsed_model
+    ]
+    _clear_parsed_model()
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
-    for cls in reversed(_classes):
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
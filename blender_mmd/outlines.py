@@ -14,6 +14,8 @@ import logging
 
 import bpy
 
+from .helpers import get_import_scale
+
 log = logging.getLogger("blender_mmd")
 
 # Thickness factor calibrated to match mmd_tools effective outline width.
@@ -35,7 +37,7 @@ def _on_thickness_mult_update(obj, _context):
     arm = obj.parent
     if not arm:
         return
-    scale = arm.get("import_scale", 0.08)
+    scale = get_import_scale(arm)
     global_mult = arm.mmd_edge_thickness
     edge_size = base_mat.get("mmd_edge_size", 1.0)
     mod.thickness = edge_size * scale * _THICKNESS_FACTOR * global_mult * obj.mmd_edge_thickness_mult
@@ -46,7 +48,7 @@ def build_outlines(armature_obj: bpy.types.Object) -> int:
 
     Returns the number of meshes that received outlines.
     """
-    scale = armature_obj.get("import_scale", 0.08)
+    scale = get_import_scale(armature_obj)
     global_mult = armature_obj.mmd_edge_thickness
     count = 0
 
@@ -212,7 +214,7 @@ def toggle_mesh_outline(mesh_obj: bpy.types.Object, armature_obj: bpy.types.Obje
         if base_mat is None or not base_mat.get("mmd_edge_enabled", False):
             return False
 
-        scale = armature_obj.get("import_scale", 0.08)
+        scale = get_import_scale(armature_obj)
         global_mult = armature_obj.mmd_edge_thickness
         per_mesh_mult = mesh_obj.mmd_edge_thickness_mult
         edge_color = base_mat.get("mmd_edge_color", [0.0, 0.0, 0.0, 1.0])
@@ -262,7 +264,7 @@ def update_mesh_outline_thickness(mesh_obj: bpy.types.Object, armature_obj: bpy.
     if not base_mat:
         return
 
-    scale = armature_obj.get("import_scale", 0.08)
+    scale = get_import_scale(armature_obj)
     global_mult = armature_obj.mmd_edge_thickness
     per_mesh_mult = mesh_obj.mmd_edge_thickness_mult
     edge_size = base_mat.get("mmd_edge_size", 1.0)
@@ -2,41 +2,45 @@
 
 from __future__ import annotations
 
-import json
-
 import bpy
 from bpy.props import EnumProperty, FloatProperty
 
 from .helpers import (
     find_mmd_armature,
     find_selected_mesh,
+    get_ik_constraints,
     get_mesh_physics_chains,
     get_mesh_sdef_count,
+    get_physics_collection,
+    load_collision_disabled,
+    load_physics_chains,
+    load_physics_data,
+    load_physics_disabled,
 )
-from .mesh import is_control_mesh
+from .mesh import find_control_mesh, is_control_mesh
+from .operators import NCC_MODE_ITEMS
 
 
 def _get_ik_chains(armature_obj) -> list[tuple[str, str, bool]]:
     """Return list of (target_bone_name, display_name, is_enabled) for all IK chains."""
+    pose_bones = armature_obj.pose.bones
     chains = []
-    for pb in armature_obj.pose.bones:
-        for c in pb.constraints:
-            if c.type == "IK" and c.subtarget:
-                target_bone = armature_obj.data.bones.get(c.subtarget)
-                if target_bone:
-                    display = target_bone.name
-                    enabled = not c.mute
-                    chains.append((c.subtarget, display, enabled))
-    chains.sort(key=lambda x: x[1])
+    for owner, c_name, subtarget in get_ik_constraints(armature_obj):
+        pb = pose_bones.get(owner)
+        c = pb.constraints.get(c_name) if pb else None
+        if c is not None:
+            chains.append((subtarget, subtarget, not c.mute))
     return chains
 
 
 def _get_physics_chains(armature_obj) -> list[dict]:
     """Return stored physics chain data from armature."""
-    chains_json = armature_obj.get("mmd_physics_chains")
-    if not chains_json:
-        return []
-    return json.loads(chains_json)
+    return load_physics_chains(armature_obj)
+
+
+def _chain_op(row, bl_idname: str, chain_index: int, **kwargs) -> None:
+    """Add a per-chain operator button to a row."""
+    row.operator(bl_idname, **kwargs).chain_index = chain_index
 
 
 # ---------------------------------------------------------------------------
@@ -186,19 +190,21 @@ class BLENDER_MMD_PT_physics(bpy.types.Panel):
         has_physics = armature_obj.get("physics_collection") is not None
 
         if has_physics:
-            col_name = armature_obj.get("physics_collection", "")
-            col = bpy.data.collections.get(col_name) if col_name else None
-            rb_count = 0
-            ncc_count = 0
+            # Counts are stored at build time; scan only for older files
+            rb_count = armature_obj.get("mmd_rb_count")
+            ncc_count = armature_obj.get("mmd_ncc_count")
+            col = None
+            if rb_count is None or ncc_count is None:
+                col = get_physics_collection(armature_obj)
+                rb_count = 0
+                ncc_count = 0
             if col:
+                from .physics import get_ncc_count
+
                 rb_col = col.children.get("Rigid Bodies")
                 if rb_col:
                     rb_count = len(rb_col.objects)
-                joint_col = col.children.get("Joints")
-                if joint_col:
-                    for obj in joint_col.objects:
-                        if obj.get("mmd_joint_index") is None and obj.rigid_body_constraint:
-                            ncc_count += 1
+                ncc_count = get_ncc_count(armature_obj)
 
             ncc_mode = armature_obj.get("mmd_ncc_mode", "proximity")
             proximity = armature_obj.get("mmd_ncc_proximity", 1.5)
@@ -234,9 +240,8 @@ class BLENDER_MMD_PT_physics(bpy.types.Panel):
             active = context.active_object
             if active and active.get("mmd_rigid_index") is not None:
                 rb_idx = active["mmd_rigid_index"]
-                phys_json = armature_obj.get("mmd_physics_data")
-                if phys_json:
-                    phys_data = json.loads(phys_json)
+                phys_data = load_physics_data(armature_obj)
+                if phys_data:
                     rbs = phys_data.get("rigid_bodies", [])
                     if 0 <= rb_idx < len(rbs):
                         rb = rbs[rb_idx]
@@ -249,15 +254,13 @@ class BLENDER_MMD_PT_physics(bpy.types.Panel):
                             f"Group: {rb['collision_group_number']}"
                         )
                         # Chain membership
-                        chains_json = armature_obj.get("mmd_physics_chains")
-                        if chains_json:
-                            for chain in json.loads(chains_json):
-                                if rb_idx in chain.get("rigid_indices", []):
-                                    box.label(
-                                        text=f"Chain: {chain['name']} ({chain.get('group', '?')})",
-                                        icon="LINKED",
-                                    )
-                                    break
+                        for chain in load_physics_chains(armature_obj):
+                            if rb_idx in chain.get("rigid_indices", []):
+                                box.label(
+                                    text=f"Chain: {chain['name']} ({chain.get('group', '?')})",
+                                    icon="LINKED",
+                                )
+                                break
                         row = box.row(align=True)
                         row.operator("blender_mmd.inspect_physics", text="Inspect", icon="VIEWZOOM")
                         row.operator("blender_mmd.select_colliders", text="Colliders", icon="SHADING_BBOX")
@@ -266,12 +269,8 @@ class BLENDER_MMD_PT_physics(bpy.types.Panel):
             # Per-chain list with toggles, select, self-collision, and remove
             chains = _get_physics_chains(armature_obj)
             if chains:
-                collision_disabled = set(json.loads(
-                    armature_obj.get("mmd_chain_collision_disabled", "[]")
-                ))
-                physics_disabled = set(json.loads(
-                    armature_obj.get("mmd_chain_physics_disabled", "[]")
-                ))
+                collision_disabled = load_collision_disabled(armature_obj)
+                physics_disabled = load_physics_disabled(armature_obj)
 
                 box = layout.box()
                 for i, chain in enumerate(chains):
@@ -283,39 +282,31 @@ class BLENDER_MMD_PT_physics(bpy.types.Panel):
 
                     # Collision toggle (eye icon)
                     col_enabled = chain_name not in collision_disabled
-                    op = row.operator(
-                        "blender_mmd.toggle_chain_collisions",
+                    _chain_op(
+                        row, "blender_mmd.toggle_chain_collisions", i,
                         text="",
                         icon="HIDE_OFF" if col_enabled else "HIDE_ON",
                         depress=col_enabled,
                     )
-                    op.chain_index = i
 
                     # Physics toggle (physics icon)
                     phys_enabled = chain_name not in physics_disabled
-                    op = row.operator(
-                        "blender_mmd.toggle_chain_physics",
+                    _chain_op(
+                        row, "blender_mmd.toggle_chain_physics", i,
                         text="",
                         icon="PHYSICS" if phys_enabled else "GHOST_DISABLED",
                         depress=phys_enabled,
                     )
-                    op.chain_index = i
 
                     # Chain name + select
-                    op = row.operator(
-                        "blender_mmd.select_chain",
+                    _chain_op(
+                        row, "blender_mmd.select_chain", i,
                         text=f"{chain_name}  ({group}, {n_bodies})",
                         icon="LINKED",
                     )
-                    op.chain_index = i
 
                     # Remove
-                    op = row.operator(
-                        "blender_mmd.remove_chain",
-                        text="",
-                        icon="X",
-                    )
-                    op.chain_index = i
+                    _chain_op(row, "blender_mmd.remove_chain", i, text="", icon="X")
         else:
             layout.label(text="No physics", icon="INFO")
             row = layout.row(align=True)
@@ -432,7 +423,6 @@ class BLENDER_MMD_PT_animation(bpy.types.Panel):
         nla_morph_tracks = 0
         if armature_obj.animation_data:
             nla_bone_tracks = len(armature_obj.animation_data.nla_tracks)
-        from .mesh import find_control_mesh
         ctrl = find_control_mesh(armature_obj)
         morph_mesh = ctrl
         if morph_mesh is None:
@@ -472,7 +462,6 @@ class BLENDER_MMD_PT_animation(bpy.types.Panel):
 
 def _find_morph_action(armature_obj) -> "bpy.types.Action | None":
     """Find the morph action from control mesh or first mesh with shape keys."""
-    from .mesh import find_control_mesh
     ctrl = find_control_mesh(armature_obj)
     if ctrl and ctrl.data.shape_keys:
         sk = ctrl.data.shape_keys
@@ -604,17 +593,15 @@ _classes = (
 )
 
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(_classes)
+
+
 def register():
-    for cls in _classes:
-        bpy.utils.register_class(cls)
+    _register_classes()
     bpy.types.Scene.mmd_ncc_mode = EnumProperty(
         name="NCC Mode",
         description="Non-collision constraint mode",
-        items=[
-            ("draft", "Draft", "No NCCs. Fast preview, bodies pass through each other"),
-            ("proximity", "Proximity", "Distance-filtered NCCs. Faster builds, may miss distant collisions"),
-            ("all", "All", "Every excluded pair gets an NCC. Most correct, most objects"),
-        ],
+        items=NCC_MODE_ITEMS,
         default="all",
     )
     bpy.types.Scene.mmd_ncc_proximity = FloatProperty(
@@ -632,5 +619,4 @@ def unregister():
         del bpy.types.Scene.mmd_ncc_proximity
     if hasattr(bpy.types.Scene, "mmd_ncc_mode"):
         del bpy.types.Scene.mmd_ncc_mode
-    for cls in reversed(_classes):
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
@@ -10,6 +10,8 @@ import json
 import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from .pmx.types import RigidBody, RigidMode, RigidShape
 from .translations import BONE_NAMES, resolve_name
 
@@ -26,6 +28,13 @@ _SHAPE_MAP = {
     RigidShape.CAPSULE: "CAPSULE",
 }
 
+# rigid_body.collision_collections values: shared layer 0 only, or none
+_SHARED_COLLISION_LAYERS = (True,) + (False,) * 19
+_NO_COLLISION_LAYERS = (False,) * 20
+
+# Names of the bone constraints that couple pose bones to tracking empties
+_TRACKING_CONSTRAINT_NAMES = frozenset(("mmd_dynamic", "mmd_dynamic_bone"))
+
 
 def build_physics(
     armature_obj, model, scale: float, mode: str = "none",
@@ -168,6 +177,10 @@ def _build_rigid_body_physics_iter(
         collection.children.link(track_col)
 
         bone_names = _build_bone_name_map(armature_obj)
+        bone_cache = _build_bone_cache(armature_obj)
+        # Every bone's pose matrix equals its rest matrix: the pose-to-rest
+        # deltas are identity, so the reposition passes can be skipped.
+        at_rest = _is_rest_pose(armature_obj, bone_cache)
 
         # Read per-chain disable states for collision layer assignment
         collision_disabled = set(json.loads(armature_obj.get("mmd_chain_collision_disabled", "[]")))
@@ -196,7 +209,10 @@ def _build_rigid_body_physics_iter(
         # --- Joints (0.25 - 0.40) ---
         n_joints = len(model.joints)
         yield (0.25, f"Creating {n_joints} joints...")
-        joint_objects = _create_joints(model, armature_obj, rigid_objects, bone_names, scale, joint_col)
+        joint_objects = _create_joints(
+            model, armature_obj, rigid_objects, bone_names, bone_cache, scale, joint_col,
+            reposition=not at_rest,
+        )
         yield (0.40, f"Created {n_joints} joints")
 
         # --- NCCs (0.40 - 0.75) ---
@@ -225,19 +241,23 @@ def _build_rigid_body_physics_iter(
         yield (0.75, "Repositioning bodies...")
 
         ik_saved_state = _mute_physics_ik_constraints(armature_obj, model, bone_names, mute=True)
-        _reposition_dynamic_bodies(model, armature_obj, rigid_objects, bone_names, scale)
+        if not at_rest:
+            _reposition_dynamic_bodies(
+                model, armature_obj, rigid_objects, bone_names, bone_cache, scale,
+            )
 
-        # Flush so matrix_world is current for tracking empty creation
+        # Flush so the IK-muted pose and repositioned rigid body matrix_world
+        # are current for tracking empty creation and reparenting
         bpy.context.scene.frame_set(bpy.context.scene.frame_current)
 
         yield (0.80, "Setting up bone coupling...")
         empty_parent_map = _setup_bone_coupling(
-            armature_obj, model, rigid_objects, bone_names, scale, track_col,
+            armature_obj, model, rigid_objects, bone_names, bone_cache, scale, track_col,
         )
 
-        # Flush so tracking empties have correct matrix_world before reparenting
-        bpy.context.scene.frame_set(bpy.context.scene.frame_current)
-
+        # No flush needed before reparenting: tracking empties got their
+        # matrix_world written directly, and the rigid bodies they parent to
+        # were last moved before the flush above.
         _reparent_tracking_empties(empty_parent_map)
 
         # Flush after reparenting so parent inverse matrices are evaluated
@@ -247,7 +267,9 @@ def _build_rigid_body_physics_iter(
         # --- Phase 3: COUPLE & ACTIVATE ---
         yield (0.90, "Activating physics world...")
 
-        _unmute_tracking_constraints(armature_obj)
+        _unmute_tracking_constraints(
+            armature_obj, [_tracking_bone_name(e) for e in empty_parent_map],
+        )
         _restore_ik_mute_state(armature_obj, ik_saved_state)
         _setup_physics_world(bpy.context.scene, scale)
 
@@ -260,6 +282,7 @@ def _build_rigid_body_physics_iter(
 
     # Store chains (already detected above)
     armature_obj["mmd_physics_chains"] = json.dumps(chain_dicts)
+    _store_physics_counts(armature_obj, collection)
 
     # Apply per-chain physics disabled (kinematic) state
     if physics_disabled:
@@ -323,15 +346,14 @@ def clear_physics(armature_obj) -> None:
             # physics on every constraint/object removal. Without this,
             # each constraint.remove() triggers a full physics solve (~36s).
             rbw = bpy.context.scene.rigidbody_world
-            if rbw:
+            if rbw and rbw.enabled:
                 rbw.enabled = False
 
             # Mute tracking constraints before batch-removing their targets.
-            _physics_constraint_names = ("mmd_dynamic", "mmd_dynamic_bone")
             if armature_obj.pose:
                 for pb in armature_obj.pose.bones:
                     for c in pb.constraints:
-                        if c.name in _physics_constraint_names:
+                        if c.name in _TRACKING_CONSTRAINT_NAMES:
                             c.mute = True
 
             # Batch-remove all physics objects in one call
@@ -350,7 +372,7 @@ def clear_physics(armature_obj) -> None:
                 for pb in armature_obj.pose.bones:
                     to_remove = [
                         c for c in pb.constraints
-                        if c.name in _physics_constraint_names
+                        if c.name in _TRACKING_CONSTRAINT_NAMES
                     ]
                     for c in to_remove:
                         pb.constraints.remove(c)
@@ -366,7 +388,8 @@ def clear_physics(armature_obj) -> None:
             del armature_obj["physics_collection"]
 
     # Clean metadata keys (preserve user settings: disabled chains, NCC mode/proximity)
-    for key in ("mmd_physics_data", "physics_mode", "mmd_physics_chains"):
+    for key in ("mmd_physics_data", "physics_mode", "mmd_physics_chains",
+                "mmd_rb_count", "mmd_ncc_count"):
         if key in armature_obj:
             del armature_obj[key]
     # Note: mmd_chain_collision_disabled, mmd_chain_physics_disabled,
@@ -382,10 +405,14 @@ def _mute_tracking_constraints(armature_obj, mute: bool = True) -> None:
     """Mute or unmute mmd_dynamic / mmd_dynamic_bone constraints on pose bones."""
     if not armature_obj.pose:
         return
-    for pb in armature_obj.pose.bones:
-        for c in pb.constraints:
-            if c.name in ("mmd_dynamic", "mmd_dynamic_bone"):
-                c.mute = mute
+    # Collect first and only write constraints whose state actually changes —
+    # every .mute write is an RNA update that tags the depsgraph.
+    targets = [
+        c for pb in armature_obj.pose.bones for c in pb.constraints
+        if c.name in _TRACKING_CONSTRAINT_NAMES and c.mute != mute
+    ]
+    for c in targets:
+        c.mute = mute
 
 
 def reset_physics(armature_obj) -> int:
@@ -437,7 +464,8 @@ def reset_physics(armature_obj) -> int:
     # even when bones should be at rest. This creates a circular dependency
     # where reset computes positions matching the already-displaced state.
     _mute_tracking_constraints(armature_obj, mute=True)
-    bpy.context.view_layer.update()
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    depsgraph.update()
 
     # Disable rigid body world to prevent cache from overriding positions
     scene = bpy.context.scene
@@ -445,7 +473,8 @@ def reset_physics(armature_obj) -> int:
     rbw_was_enabled = False
     if rbw:
         rbw_was_enabled = rbw.enabled
-        rbw.enabled = False
+        if rbw_was_enabled:
+            rbw.enabled = False
 
     # Reposition dynamic rigid bodies
     count = 0
@@ -485,16 +514,15 @@ def reset_physics(armature_obj) -> int:
 
     # Flush RB positions to depsgraph — tracking empties are parented to RBs,
     # so parent matrix_world must be current before we set empty.matrix_world
-    bpy.context.view_layer.update()
+    depsgraph.update()
 
     # Reposition tracking empties to match bone world positions
     track_col = collection.children.get("Tracking")
     if track_col:
         for empty in track_col.objects:
-            # Track_<bone_name>
-            if not empty.name.startswith("Track_"):
+            bone_name = _tracking_bone_name(empty)
+            if bone_name is None:
                 continue
-            bone_name = empty.name[6:]  # strip "Track_"
             pb = armature_obj.pose.bones.get(bone_name)
             if pb is None:
                 continue
@@ -539,7 +567,7 @@ def reset_physics(armature_obj) -> int:
             obj.rotation_euler = r.to_euler(obj.rotation_mode)
 
     # Flush repositioned transforms to depsgraph while physics is still disabled
-    bpy.context.view_layer.update()
+    depsgraph.update()
 
     # Re-enable rigid body world with cleared cache
     if rbw and rbw_was_enabled:
@@ -621,29 +649,33 @@ def remove_chain(armature_obj, chain_index: int) -> str:
 
     # Remove tracking empties and bone constraints for chain bones
     track_col = collection.children.get("Tracking")
+    track_empties = {}
+    if track_col:
+        for obj in track_col.objects:
+            bname = _tracking_bone_name(obj)
+            if bname is not None:
+                track_empties[bname] = obj
     for bone_idx in chain_bone_indices:
         bname = bone_names.get(bone_idx)
         if not bname:
             continue
 
         # Remove tracking empty
-        if track_col:
-            empty_name = f"Track_{bname}"
-            for obj in list(track_col.objects):
-                if obj.name == empty_name:
-                    bpy.data.objects.remove(obj, do_unlink=True)
-                    break
+        empty = track_empties.pop(bname, None)
+        if empty is not None:
+            bpy.data.objects.remove(empty, do_unlink=True)
 
         # Remove physics constraints on the bone
         pb = armature_obj.pose.bones.get(bname)
         if pb:
             for c in list(pb.constraints):
-                if c.name in ("mmd_dynamic", "mmd_dynamic_bone"):
+                if c.name in _TRACKING_CONSTRAINT_NAMES:
                     pb.constraints.remove(c)
 
     # Update stored chain data (remove this chain)
     chains.pop(chain_index)
     armature_obj["mmd_physics_chains"] = json.dumps(chains)
+    _store_physics_counts(armature_obj, collection)
 
     # Flush depsgraph so freed bones snap back to rest/keyframed pose
     bpy.context.scene.frame_set(bpy.context.scene.frame_current)
@@ -735,7 +767,8 @@ def rebuild_ncc(armature_obj) -> tuple[int, int]:
     rbw_was_enabled = False
     if rbw:
         rbw_was_enabled = rbw.enabled
-        rbw.enabled = False
+        if rbw_was_enabled:
+            rbw.enabled = False
 
     try:
         # Reassign existing NCC empties to new pairs (no create/delete needed)
@@ -769,6 +802,8 @@ def rebuild_ncc(armature_obj) -> tuple[int, int]:
         if rbw and rbw_was_enabled:
             rbw.enabled = True
 
+    armature_obj["mmd_ncc_count"] = new_count
+
     # Clear physics cache
     scene.frame_set(scene.frame_current)
 
@@ -785,7 +820,8 @@ def _compute_ncc_pairs(
 ) -> list[tuple]:
     """Compute non-collision pair table from serialized physics data.
 
-    Pure Python except for rigid_objects references in the output tuples.
+    No Blender imports; rigid_objects are only read for location and passed
+    through to the output tuples.
     Used by both initial build (via _create_non_collision_constraints) and
     rebuild_ncc to avoid re-parsing PMX.
 
@@ -806,73 +842,85 @@ def _compute_ncc_pairs(
 
     n_bodies = len(rigid_objects)
 
-    # Precompute bounding ranges for proximity filtering (scaled to Blender units)
-    bounding_ranges: list[float] = []
-    if ncc_proximity > 0:
-        bounding_ranges = [_rigid_bounding_range(rb) * scale for rb in rb_data_list]
-
-    # Group rigid body indices by collision_group_number
-    group_map: dict[int, list[int]] = {}
-    for i, rb in enumerate(rb_data_list):
-        group_map.setdefault(rb["collision_group_number"], []).append(i)
-
     # Map joint pairs (already have disable_collisions on joint objects)
-    joint_pair_set: set[frozenset] = set()
+    joint_pair_keys: set[int] = set()
     for joint in joints_data:
         src, dst = joint["src_rigid"], joint["dest_rigid"]
         if 0 <= src < n_bodies and 0 <= dst < n_bodies:
-            joint_pair_set.add(frozenset((src, dst)))
+            joint_pair_keys.add(_pair_key(src, dst))
+
+    # Find non-colliding pairs. excluded[i, j]: body i's mask leaves out
+    # body j's group (groups outside 0-15 are never excluded).
+    n_rb = len(rb_data_list)
+    groups = np.fromiter(
+        (rb["collision_group_number"] for rb in rb_data_list), dtype=np.int64, count=n_rb,
+    )
+    masks = np.fromiter(
+        (rb["collision_group_mask"] for rb in rb_data_list), dtype=np.int64, count=n_rb,
+    )
+    valid_group = (groups >= 0) & (groups < 16)
+    bits = (masks[:, None] >> np.where(valid_group, groups, 0)[None, :]) & 1
+    excluded = (bits == 0) & valid_group[None, :]
+    np.fill_diagonal(excluded, False)
+
+    # Each unordered pair is reported once, from the first body (in index
+    # order) whose mask excludes the other; within a body, partners are
+    # ordered by (group, index).
+    first = excluded & ~np.tril(excluded.T, k=-1)
+    rows, cols = np.nonzero(first)
+    order = np.lexsort((cols, groups[cols], rows))
+    rows, cols = rows[order], cols[order]
+
+    if joint_pair_keys and len(rows):
+        keys = (np.minimum(rows, cols) << 32) | np.maximum(rows, cols)
+        not_joint = ~np.isin(keys, np.fromiter(joint_pair_keys, dtype=np.int64))
+        rows, cols = rows[not_joint], cols[not_joint]
+
+    # Proximity filter: drop pairs that are too far apart. Bounding ranges
+    # are scaled to Blender units; objects without a location always pass.
+    if ncc_proximity > 0 and len(rows):
+        ranges = np.array(
+            [_rigid_bounding_range(rb) * scale for rb in rb_data_list], dtype=np.float64,
+        )
+        has_pos = np.array([hasattr(obj, "location") for obj in rigid_objects], dtype=bool)
+        pos = np.array(
+            [tuple(obj.location) if hp else (0.0, 0.0, 0.0)
+             for obj, hp in zip(rigid_objects, has_pos)],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        delta = pos[rows] - pos[cols]
+        distance = np.sqrt(
+            delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1] + delta[:, 2] * delta[:, 2]
+        )
+        threshold = ncc_proximity * (ranges[rows] + ranges[cols]) * 0.5
+        too_far = has_pos[rows] & has_pos[cols] & (distance >= threshold)
+        rows, cols = rows[~too_far], cols[~too_far]
 
-    # Find non-colliding pairs
-    non_collision_pairs: set[frozenset] = set()
     pair_table: list[tuple] = []
 
-    for i, rb_a in enumerate(rb_data_list):
+    for i, j in zip(rows.tolist(), cols.tolist()):
         chain_a = rigid_to_chain.get(i)
-        mask_a = rb_a["collision_group_mask"]
-        for grp in range(16):
-            if mask_a & (1 << grp):
-                continue
-            for j in group_map.get(grp, []):
-                if i == j:
-                    continue
-                pair = frozenset((i, j))
-                if pair in non_collision_pairs:
-                    continue
-                non_collision_pairs.add(pair)
-
-                if pair in joint_pair_set:
-                    continue
-
-                chain_b = rigid_to_chain.get(j)
-                if chain_a and chain_a in collision_disabled_chains:
-                    continue
-                if chain_b and chain_b in collision_disabled_chains:
-                    continue
-
-                obj_a = rigid_objects[i]
-                obj_b = rigid_objects[j]
-                if obj_a is None or obj_b is None:
-                    continue
-
-                # Proximity filter: skip pairs that are too far apart
-                if ncc_proximity > 0:
-                    pos_a = obj_a.location if hasattr(obj_a, 'location') else None
-                    pos_b = obj_b.location if hasattr(obj_b, 'location') else None
-                    if pos_a is not None and pos_b is not None:
-                        dx = pos_a[0] - pos_b[0]
-                        dy = pos_a[1] - pos_b[1]
-                        dz = pos_a[2] - pos_b[2]
-                        distance = (dx*dx + dy*dy + dz*dz) ** 0.5
-                        threshold = ncc_proximity * (bounding_ranges[i] + bounding_ranges[j]) * 0.5
-                        if distance >= threshold:
-                            continue
-
-                pair_table.append((obj_a, obj_b))
+        chain_b = rigid_to_chain.get(j)
+        if chain_a and chain_a in collision_disabled_chains:
+            continue
+        if chain_b and chain_b in collision_disabled_chains:
+            continue
+
+        obj_a = rigid_objects[i]
+        obj_b = rigid_objects[j]
+        if obj_a is None or obj_b is None:
+            continue
+
+        pair_table.append((obj_a, obj_b))
 
     return pair_table
 
 
+def _pair_key(a: int, b: int) -> int:
+    """Order-independent int key for a body index pair."""
+    return (a << 32) | b if a < b else (b << 32) | a
+
+
 def _rigid_bounding_range(rb_data: dict) -> float:
     """Bounding box diagonal of a rigid body shape.
 
@@ -944,7 +992,7 @@ def toggle_chain_collisions(armature_obj, chain_index: int, enable: bool) -> str
             rigid = _rb_data_to_rigid(rb_data)
             rb.collision_collections = _build_collision_collections(rigid)
         else:
-            rb.collision_collections = [False] * 20
+            rb.collision_collections = _NO_COLLISION_LAYERS
 
     # Update disabled chains list
     disabled = set(json.loads(armature_obj.get("mmd_chain_collision_disabled", "[]")))
@@ -1051,6 +1099,13 @@ def get_ncc_count(armature_obj) -> int:
     return count
 
 
+def _store_physics_counts(armature_obj, collection) -> None:
+    """Store rigid body / NCC counts on the armature for the physics panel."""
+    rb_col = collection.children.get("Rigid Bodies")
+    armature_obj["mmd_rb_count"] = len(rb_col.objects) if rb_col else 0
+    armature_obj["mmd_ncc_count"] = get_ncc_count(armature_obj)
+
+
 def _rb_data_to_rigid(rb_data: dict) -> RigidBody:
     """Create a minimal RigidBody from serialized data for collision layer computation."""
     return RigidBody(
@@ -1075,7 +1130,8 @@ def _rb_data_to_rigid(rb_data: dict) -> RigidBody:
 def serialize_physics_data(model) -> str:
     """Serialize rigid body + joint data from a PMX model to JSON string.
 
-    Pure Python — no Blender imports needed.
+    Pure Python — no Blender imports needed. Vector fields stay tuples;
+    json encodes them as arrays directly.
     """
     rigid_bodies = []
     for rb in model.rigid_bodies:
@@ -1087,9 +1143,9 @@ def serialize_physics_data(model) -> str:
             "collision_group_number": rb.collision_group_number,
             "collision_group_mask": rb.collision_group_mask,
             "shape": rb.shape.value,
-            "size": list(rb.size),
-            "position": list(rb.position),
-            "rotation": list(rb.rotation),
+            "size": rb.size,
+            "position": rb.position,
+            "rotation": rb.rotation,
             "mass": rb.mass,
             "linear_damping": rb.linear_damping,
             "angular_damping": rb.angular_damping,
@@ -1104,17 +1160,19 @@ def serialize_physics_data(model) -> str:
             "name_e": j.name_e,
             "src_rigid": j.src_rigid,
             "dest_rigid": j.dest_rigid,
-            "position": list(j.position),
-            "rotation": list(j.rotation),
-            "limit_move_lower": list(j.limit_move_lower),
-            "limit_move_upper": list(j.limit_move_upper),
-            "limit_rotate_lower": list(j.limit_rotate_lower),
-            "limit_rotate_upper": list(j.limit_rotate_upper),
-            "spring_constant_move": list(j.spring_constant_move),
-            "spring_constant_rotate": list(j.spring_constant_rotate),
+            "position": j.position,
+            "rotation": j.rotation,
+            "limit_move_lower": j.limit_move_lower,
+            "limit_move_upper": j.limit_move_upper,
+            "limit_rotate_lower": j.limit_rotate_lower,
+            "limit_rotate_upper": j.limit_rotate_upper,
+            "spring_constant_move": j.spring_constant_move,
+            "spring_constant_rotate": j.spring_constant_rotate,
         })
 
-    return json.dumps({"rigid_bodies": rigid_bodies, "joints": joints})
+    return json.dumps(
+        {"rigid_bodies": rigid_bodies, "joints": joints}, separators=(",", ":"),
+    )
 
 
 def deserialize_physics_data(json_str: str) -> dict:
@@ -1132,6 +1190,33 @@ def _build_bone_name_map(armature_obj) -> dict[int, str]:
     return result
 
 
+_REST_POSE_TOLERANCE = 1e-5
+
+
+def _is_rest_pose(armature_obj, bone_cache: dict) -> bool:
+    """True if every bone's pose matrix matches its rest matrix.
+
+    Compares pb.matrix (the evaluated pose, including IK and other
+    constraints) with bone.matrix_local — exactly the two matrices the
+    reposition delta is built from.
+    """
+    if armature_obj.data.pose_position == "REST":
+        return True
+    tol = _REST_POSE_TOLERANCE
+    for bone, pb in bone_cache.values():
+        for pose_row, rest_row in zip(pb.matrix, bone.matrix_local):
+            for a, b in zip(pose_row, rest_row):
+                if abs(a - b) > tol:
+                    return False
+    return True
+
+
+def _build_bone_cache(armature_obj) -> dict[str, tuple]:
+    """Map Blender bone name → (Bone, PoseBone), built once per physics build."""
+    pose_bones = armature_obj.pose.bones
+    return {bone.name: (bone, pose_bones[bone.name]) for bone in armature_obj.data.bones}
+
+
 def _create_rigid_bodies(
     model, armature_obj, scale: float, collection,
     draft: bool = False,
@@ -1170,12 +1255,24 @@ def _create_rigid_bodies(
         obj.display_type = "WIRE"
         obj.hide_render = True
 
-        # Make active and add to rigid body world
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        bpy.ops.rigidbody.object_add()
-        obj.select_set(False)
+        # Store PMX index for joint lookups
+        obj["mmd_rigid_index"] = i
+
+        rigid_objects.append(obj)
+
+    if not rigid_objects:
+        return rigid_objects
+
+    # Add all bodies to the rigid body world in one operator call
+    with bpy.context.temp_override(
+        active_object=rigid_objects[0],
+        object=rigid_objects[0],
+        selected_objects=rigid_objects,
+        selected_editable_objects=rigid_objects,
+    ):
+        bpy.ops.rigidbody.objects_add(type="ACTIVE")
 
+    for i, (obj, rigid) in enumerate(zip(rigid_objects, model.rigid_bodies)):
         rb = obj.rigid_body
         rb.collision_shape = _SHAPE_MAP[rigid.shape]
         rb.mass = rigid.mass
@@ -1189,7 +1286,7 @@ def _create_rigid_bodies(
         # Also disable collisions for bodies in collision-disabled chains
         chain_name = rigid_to_chain.get(i)
         if draft or (chain_name and chain_name in collision_disabled_chains):
-            rb.collision_collections = [False] * 20
+            rb.collision_collections = _NO_COLLISION_LAYERS
         else:
             rb.collision_collections = _build_collision_collections(rigid)
 
@@ -1198,11 +1295,6 @@ def _create_rigid_bodies(
         rb.use_margin = True
         rb.collision_margin = 1e-6
 
-        # Store PMX index for joint lookups
-        obj["mmd_rigid_index"] = i
-
-        rigid_objects.append(obj)
-
     return rigid_objects
 
 
@@ -1243,43 +1335,44 @@ def _build_shape_mesh(obj, rigid: RigidBody, scale: float) -> None:
     bm.free()
 
 
-def _build_capsule_mesh(bm, radius: float, height: float, segments: int = 8, rings: int = 3) -> None:
-    """Build a capsule mesh in bmesh: cylinder + hemisphere caps along Z axis."""
+# Unit capsule geometry per (segments, rings): vertices as (x, y, z, side)
+# for radius 1, where side (+1/-1/0) selects the half-height offset.
+_capsule_templates: dict[tuple[int, int], tuple[list, list]] = {}
+
+
+def _unit_capsule(segments: int, rings: int) -> tuple[list, list]:
+    """Return (unit_verts, faces) for a capsule, computing the trig once."""
     import math
 
-    verts = bm.verts
-    half_h = height / 2.0
+    key = (segments, rings)
+    cached = _capsule_templates.get(key)
+    if cached is not None:
+        return cached
 
-    # Top cap vertex
-    verts.new((0, 0, half_h + radius))
+    ring_dirs = [
+        (math.cos(2 * math.pi * j / segments), math.sin(2 * math.pi * j / segments))
+        for j in range(segments)
+    ]
+    unit_verts = [(0.0, 0.0, 1.0, 1)]  # top cap
 
     # Upper hemisphere rings
     for i in range(rings, 0, -1):
-        z = radius * math.sin(0.5 * math.pi * i / rings)
-        r = math.sqrt(radius ** 2 - z ** 2)
-        for j in range(segments):
-            theta = 2 * math.pi * j / segments
-            verts.new((r * math.cos(theta), r * math.sin(theta), z + half_h))
+        z = math.sin(0.5 * math.pi * i / rings)
+        r = math.sqrt(1.0 - z * z)
+        unit_verts.extend((r * c, r * s, z, 1) for c, s in ring_dirs)
 
     # Lower hemisphere rings
     for i in range(rings):
-        z = -radius * math.sin(0.5 * math.pi * i / rings)
-        r = math.sqrt(radius ** 2 - z ** 2)
-        for j in range(segments):
-            theta = 2 * math.pi * j / segments
-            verts.new((r * math.cos(theta), r * math.sin(theta), z - half_h))
+        z = -math.sin(0.5 * math.pi * i / rings)
+        r = math.sqrt(1.0 - z * z)
+        unit_verts.extend((r * c, r * s, z, -1) for c, s in ring_dirs)
 
-    # Bottom cap vertex
-    verts.new((0, 0, -(half_h + radius)))
-
-    verts.ensure_lookup_table()
-    faces = bm.faces
-    n = len(verts)
+    unit_verts.append((0.0, 0.0, -1.0, -1))  # bottom cap
 
+    faces = []
     # Top fan
     for j in range(segments):
-        j2 = (j + 1) % segments
-        faces.new([verts[0], verts[1 + j], verts[1 + j2]])
+        faces.append((0, 1 + j, 1 + (j + 1) % segments))
 
     # Quads for body rings
     total_rings = rings * 2
@@ -1287,19 +1380,32 @@ def _build_capsule_mesh(bm, radius: float, height: float, segments: int = 8, rin
         base = 1 + ring * segments
         for j in range(segments):
             j2 = (j + 1) % segments
-            faces.new([
-                verts[base + j],
-                verts[base + segments + j],
-                verts[base + segments + j2],
-                verts[base + j2],
-            ])
+            faces.append((base + j, base + segments + j, base + segments + j2, base + j2))
 
     # Bottom fan
-    last = n - 1
+    last = len(unit_verts) - 1
     base = 1 + (total_rings - 1) * segments
     for j in range(segments):
-        j2 = (j + 1) % segments
-        faces.new([verts[last], verts[base + j2], verts[base + j]])
+        faces.append((last, base + (j + 1) % segments, base + j))
+
+    cached = (unit_verts, faces)
+    _capsule_templates[key] = cached
+    return cached
+
+
+def _build_capsule_mesh(bm, radius: float, height: float, segments: int = 8, rings: int = 3) -> None:
+    """Build a capsule mesh in bmesh: cylinder + hemisphere caps along Z axis."""
+    unit_verts, faces = _unit_capsule(segments, rings)
+    half_h = height / 2.0
+
+    new_vert = bm.verts.new
+    verts = [
+        new_vert((x * radius, y * radius, z * radius + side * half_h))
+        for x, y, z, side in unit_verts
+    ]
+    new_face = bm.faces.new
+    for face in faces:
+        new_face([verts[i] for i in face])
 
 
 def build_collision_collections(
@@ -1313,7 +1419,7 @@ def build_collision_collections(
         draft: If True, returns all False (no collisions).
     """
     if draft:
-        return [False] * 20
+        return list(_NO_COLLISION_LAYERS)
     return _build_collision_collections(rigid)
 
 
@@ -1335,12 +1441,12 @@ def _build_collision_collections(rigid: RigidBody) -> list[bool]:
     (both masks must agree), so we cannot encode PMX masks in Blender layers.
     Instead, we use shared layer 0 + NCC constraint empties for exclusion.
     """
-    cols = [False] * 20
-    cols[0] = True  # shared layer — all bodies can potentially collide
-    return cols
+    return list(_SHARED_COLLISION_LAYERS)
 
 
-def _reposition_dynamic_bodies(model, armature_obj, rigid_objects, bone_names, scale) -> None:
+def _reposition_dynamic_bodies(
+    model, armature_obj, rigid_objects, bone_names, bone_cache, scale,
+) -> None:
     """Reposition dynamic rigid bodies to match current bone pose.
 
     PMX rigid body positions are in rest-pose coordinates. If VMD animation
@@ -1353,23 +1459,25 @@ def _reposition_dynamic_bodies(model, armature_obj, rigid_objects, bone_names, s
     """
     from mathutils import Euler, Matrix, Vector
 
+    # World-space delta = mw @ pose @ rest^-1 @ mw^-1; the armature terms
+    # are the same for every body.
+    mw = armature_obj.matrix_world.copy()
+    mw_inv = mw.inverted()
+
     for i, rigid in enumerate(model.rigid_bodies):
         if rigid.mode == RigidMode.STATIC:
             continue
         if rigid.bone_index < 0:
             continue
-        bone_name = bone_names.get(rigid.bone_index)
-        if not bone_name or bone_name not in armature_obj.data.bones:
+        entry = bone_cache.get(bone_names.get(rigid.bone_index))
+        if entry is None:
             continue
 
         obj = rigid_objects[i]
-        bone = armature_obj.data.bones[bone_name]
-        pb = armature_obj.pose.bones[bone_name]
+        bone, pb = entry
 
         # Compute pose-to-rest delta in world space
-        rest_world = armature_obj.matrix_world @ bone.matrix_local
-        pose_world = armature_obj.matrix_world @ pb.matrix
-        delta = pose_world @ rest_world.inverted()
+        delta = mw @ pb.matrix @ bone.matrix_local.inverted() @ mw_inv
 
         # Build local matrix from known PMX data (don't use stale matrix_world)
         rx, ry, rz = rigid.rotation
@@ -1384,44 +1492,78 @@ def _reposition_dynamic_bodies(model, armature_obj, rigid_objects, bone_names, s
 
 
 def _create_joints(model, armature_obj, rigid_objects: list, bone_names: dict,
-                   scale: float, collection) -> list:
+                   bone_cache: dict, scale: float, collection,
+                   reposition: bool = True) -> list:
     """Create joint constraints with GENERIC_SPRING and actual spring values.
 
     Joint empties are repositioned to match bone pose (same delta as
-    _reposition_dynamic_bodies) using the source rigid body's bone.
+    _reposition_dynamic_bodies) using the source rigid body's bone, unless
+    ``reposition`` is False (armature in rest pose).
     """
     import bpy
     from mathutils import Euler, Vector
 
-    joint_objects = []
+    joints = model.joints
+    if not joints:
+        return []
 
-    for i, joint in enumerate(model.joints):
-        en_name = resolve_name(joint.name, joint.name_e, BONE_NAMES)
-        name = f"J_{i:03d}_{en_name}"
+    # One GENERIC_SPRING template carrying the settings shared by every
+    # joint, duplicated by doubling instead of one constraint_add per joint.
+    for obj in bpy.context.selected_objects:
+        obj.select_set(False)
 
-        obj = bpy.data.objects.new(name, None)
+    template = bpy.data.objects.new("J_template", None)
+    template.empty_display_type = "ARROWS"
+    template.empty_display_size = 0.02
+    template.rotation_mode = "YXZ"
+    collection.objects.link(template)
+
+    bpy.context.view_layer.objects.active = template
+    template.select_set(True)
+    bpy.ops.rigidbody.constraint_add(type="GENERIC_SPRING")
+
+    rbc = template.rigid_body_constraint
+    rbc.disable_collisions = False
+
+    # Enable all 6 DOF limits
+    rbc.use_limit_lin_x = True
+    rbc.use_limit_lin_y = True
+    rbc.use_limit_lin_z = True
+    rbc.use_limit_ang_x = True
+    rbc.use_limit_ang_y = True
+    rbc.use_limit_ang_z = True
+
+    # Springs provide restoring force that keeps chain bodies together.
+    # Without springs, bodies scatter to joint limit edges under gravity.
+    rbc.use_spring_x = True
+    rbc.use_spring_y = True
+    rbc.use_spring_z = True
+    rbc.use_spring_ang_x = True
+    rbc.use_spring_ang_y = True
+    rbc.use_spring_ang_z = True
+
+    joint_objects = _duplicate_by_doubling(bpy, template, len(joints))
+
+    mw = armature_obj.matrix_world.copy()
+    mw_inv = mw.inverted()
+
+    for i, (obj, joint) in enumerate(zip(joint_objects, joints)):
+        en_name = resolve_name(joint.name, joint.name_e, BONE_NAMES)
+        obj.name = f"J_{i:03d}_{en_name}"
         obj["mmd_name_j"] = joint.name
-        obj.empty_display_type = "ARROWS"
-        obj.empty_display_size = 0.02
-        collection.objects.link(obj)
 
-        obj.location = Vector(joint.position) * scale
-        obj.rotation_mode = "YXZ"
+        loc = Vector(joint.position) * scale
         # Negate rotation for handedness change (same as rigid bodies)
         rx, ry, rz = joint.rotation
-        obj.rotation_euler = Euler((-rx, -ry, -rz), "YXZ")
+        rot = Euler((-rx, -ry, -rz), "YXZ")
+        obj.location = loc
+        obj.rotation_euler = rot
 
         # Reposition joint to match posed bone (using src_rigid's bone)
-        _reposition_joint_empty(obj, joint, model, armature_obj, bone_names, scale)
-
-        # Add rigid body constraint
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        bpy.ops.rigidbody.constraint_add(type="GENERIC_SPRING")
-        obj.select_set(False)
+        if reposition:
+            _reposition_joint_empty(obj, loc, rot, joint, model, mw, mw_inv, bone_names, bone_cache)
 
         rbc = obj.rigid_body_constraint
-        rbc.disable_collisions = False
 
         # Connect to rigid bodies
         if 0 <= joint.src_rigid < len(rigid_objects):
@@ -1429,14 +1571,6 @@ def _create_joints(model, armature_obj, rigid_objects: list, bone_names: dict,
         if 0 <= joint.dest_rigid < len(rigid_objects):
             rbc.object2 = rigid_objects[joint.dest_rigid]
 
-        # Enable all 6 DOF limits
-        rbc.use_limit_lin_x = True
-        rbc.use_limit_lin_y = True
-        rbc.use_limit_lin_z = True
-        rbc.use_limit_ang_x = True
-        rbc.use_limit_ang_y = True
-        rbc.use_limit_ang_z = True
-
         # Translation limits (with scale)
         rbc.limit_lin_x_lower = joint.limit_move_lower[0] * scale
         rbc.limit_lin_x_upper = joint.limit_move_upper[0] * scale
@@ -1456,15 +1590,6 @@ def _create_joints(model, armature_obj, rigid_objects: list, bone_names: dict,
         rbc.limit_ang_z_lower = -joint.limit_rotate_upper[2]
         rbc.limit_ang_z_upper = -joint.limit_rotate_lower[2]
 
-        # Springs provide restoring force that keeps chain bodies together.
-        # Without springs, bodies scatter to joint limit edges under gravity.
-        rbc.use_spring_x = True
-        rbc.use_spring_y = True
-        rbc.use_spring_z = True
-        rbc.use_spring_ang_x = True
-        rbc.use_spring_ang_y = True
-        rbc.use_spring_ang_z = True
-
         rbc.spring_stiffness_x = joint.spring_constant_move[0]
         rbc.spring_stiffness_y = joint.spring_constant_move[1]
         rbc.spring_stiffness_z = joint.spring_constant_move[2]
@@ -1477,40 +1602,37 @@ def _create_joints(model, armature_obj, rigid_objects: list, bone_names: dict,
         # Keep functions in file — tested and may re-enable for experimentation.
 
         obj["mmd_joint_index"] = i
-        joint_objects.append(obj)
+
+    for obj in bpy.context.selected_objects:
+        obj.select_set(False)
 
     return joint_objects
 
 
-def _reposition_joint_empty(obj, joint, model, armature_obj, bone_names, scale) -> None:
+def _reposition_joint_empty(
+    obj, loc, rot, joint, model, mw, mw_inv, bone_names, bone_cache,
+) -> None:
     """Apply pose-to-rest delta to a joint empty using its src_rigid's bone.
 
-    Builds the local matrix from the joint position/rotation directly instead
-    of reading obj.matrix_world, which is stale for newly created objects
-    (depsgraph hasn't evaluated yet).
+    Builds the local matrix from the scaled location and Euler that
+    _create_joints already computed, instead of reading obj.matrix_world,
+    which is stale for newly created objects (depsgraph hasn't evaluated yet).
     """
-    from mathutils import Euler, Matrix, Vector
+    from mathutils import Matrix
 
     if joint.src_rigid < 0 or joint.src_rigid >= len(model.rigid_bodies):
         return
     src_rigid = model.rigid_bodies[joint.src_rigid]
     if src_rigid.bone_index < 0:
         return
-    bone_name = bone_names.get(src_rigid.bone_index)
-    if not bone_name or bone_name not in armature_obj.data.bones:
+    entry = bone_cache.get(bone_names.get(src_rigid.bone_index))
+    if entry is None:
         return
 
-    bone = armature_obj.data.bones[bone_name]
-    pb = armature_obj.pose.bones[bone_name]
-
-    rest_world = armature_obj.matrix_world @ bone.matrix_local
-    pose_world = armature_obj.matrix_world @ pb.matrix
-    delta = pose_world @ rest_world.inverted()
+    bone, pb = entry
+    delta = mw @ pb.matrix @ bone.matrix_local.inverted() @ mw_inv
 
     # Build local matrix from known location/rotation (don't use stale matrix_world)
-    rx, ry, rz = joint.rotation
-    loc = Vector(joint.position) * scale
-    rot = Euler((-rx, -ry, -rz), "YXZ")
     local_matrix = Matrix.Translation(loc) @ rot.to_matrix().to_4x4()
 
     new_matrix = delta @ local_matrix
@@ -1596,6 +1718,40 @@ def _create_non_collision_constraints(
         _create_non_collision_empties(bpy, pair_table, collection)
 
 
+def _duplicate_by_doubling(bpy, template, total: int) -> list:
+    """Return ``total`` objects: the selected template plus duplicates.
+
+    Each bpy.ops.object.duplicate() call copies everything made so far, so
+    N objects take O(log N) operator calls. Overshoot is removed.
+
+    The template must be the only selected object. Copies are
+    interchangeable, so each round reuses the previous round's selection
+    (the fresh copies) and only flips the difference, instead of
+    deselecting and reselecting every object.
+    """
+    all_objs = [template]
+    selected = [template]
+    while len(all_objs) < total:
+        to_dup = min(total - len(all_objs), len(all_objs))
+        n_sel = len(selected)
+        if to_dup < n_sel:
+            for obj in selected[to_dup:]:
+                obj.select_set(False)
+        elif to_dup > n_sel:
+            # all_objs ends with the selected copies; pick from the front
+            for obj in all_objs[:to_dup - n_sel]:
+                obj.select_set(True)
+        bpy.ops.object.duplicate()
+        selected = list(bpy.context.selected_objects)
+        all_objs.extend(selected)
+
+    # Trim to exact count
+    extras = all_objs[total:]
+    for obj in extras:
+        bpy.data.objects.remove(obj, do_unlink=True)
+    return all_objs[:total]
+
+
 def _create_non_collision_empties(bpy, pair_table: list[tuple], collection) -> None:
     """Create GENERIC constraint empties for non-colliding body pairs.
 
@@ -1622,24 +1778,7 @@ def _create_non_collision_empties(bpy, pair_table: list[tuple], collection) -> N
     bpy.ops.rigidbody.constraint_add(type="GENERIC")
     template.rigid_body_constraint.disable_collisions = True
 
-    # Duplicate using doubling strategy
-    all_objs = [template]
-    while len(all_objs) < total:
-        needed = total - len(all_objs)
-        for obj in bpy.context.selected_objects:
-            obj.select_set(False)
-        to_dup = min(needed, len(all_objs))
-        for obj in all_objs[:to_dup]:
-            obj.select_set(True)
-        bpy.ops.object.duplicate()
-        new_objs = list(bpy.context.selected_objects)
-        all_objs.extend(new_objs)
-
-    # Trim to exact count
-    extras = all_objs[total:]
-    all_objs = all_objs[:total]
-    for obj in extras:
-        bpy.data.objects.remove(obj, do_unlink=True)
+    all_objs = _duplicate_by_doubling(bpy, template, total)
 
     # Assign pairs to constraint empties
     for ncc_obj, (obj_a, obj_b) in zip(all_objs, pair_table):
@@ -1653,7 +1792,7 @@ def _create_non_collision_empties(bpy, pair_table: list[tuple], collection) -> N
 
 def _setup_bone_coupling(
     armature_obj, model, rigid_objects: list,
-    bone_names: dict[int, str], scale: float, collection,
+    bone_names: dict[int, str], bone_cache: dict, scale: float, collection,
 ) -> dict:
     """Wire up bone↔rigid body for STATIC/DYNAMIC/DYNAMIC_BONE modes.
 
@@ -1661,66 +1800,66 @@ def _setup_bone_coupling(
     deferred reparenting in _reparent_tracking_empties().
     """
     empty_parent_map: dict = {}
+    mw = armature_obj.matrix_world.copy()
 
-    # Track which bones already have a dynamic rigid body assigned.
-    # If multiple target the same bone, use the heaviest.
-    bone_assignments: dict[str, tuple[float, int]] = {}  # bone_name → (mass, rigid_index)
+    # Heaviest dynamic rigid body per bone, indexed by PMX bone index
+    # (-1 = none). If multiple target the same bone, use the heaviest.
+    rigid_bodies = model.rigid_bodies
+    heaviest = [-1] * (max(bone_names, default=-1) + 1)
 
-    for i, rigid in enumerate(model.rigid_bodies):
-        if rigid.bone_index < 0:
+    for i, rigid in enumerate(rigid_bodies):
+        bone_index = rigid.bone_index
+        if bone_index < 0:
             continue
-        bone_name = bone_names.get(rigid.bone_index)
+        bone_name = bone_names.get(bone_index)
         if not bone_name:
             continue
 
         if rigid.mode == RigidMode.STATIC:
-            _setup_static_coupling(armature_obj, rigid_objects[i], bone_name)
+            _setup_static_coupling(armature_obj, mw, rigid_objects[i], bone_cache[bone_name][0])
         elif rigid.mode in (RigidMode.DYNAMIC, RigidMode.DYNAMIC_BONE):
-            prev = bone_assignments.get(bone_name)
-            if prev is None or rigid.mass > prev[0]:
-                bone_assignments[bone_name] = (rigid.mass, i)
+            prev = heaviest[bone_index]
+            if prev < 0 or rigid.mass > rigid_bodies[prev].mass:
+                heaviest[bone_index] = i
 
     # Apply dynamic couplings (heaviest wins per bone)
-    for bone_name, (mass, rigid_idx) in bone_assignments.items():
-        rigid = model.rigid_bodies[rigid_idx]
+    for bone_index, rigid_idx in enumerate(heaviest):
+        if rigid_idx < 0:
+            continue
+        rigid = rigid_bodies[rigid_idx]
         rb_obj = rigid_objects[rigid_idx]
+        pb = bone_cache[bone_names[bone_index]][1]
         if rigid.mode == RigidMode.DYNAMIC:
-            pair = _setup_dynamic_coupling(armature_obj, rb_obj, bone_name, collection)
+            pair = _setup_dynamic_coupling(mw, rb_obj, pb, collection)
         else:
-            pair = _setup_dynamic_bone_coupling(armature_obj, rb_obj, bone_name, collection)
+            pair = _setup_dynamic_bone_coupling(mw, rb_obj, pb, collection)
         empty_parent_map[pair[0]] = pair[1]
 
     return empty_parent_map
 
 
-def _setup_static_coupling(armature_obj, rb_obj, bone_name: str) -> None:
+def _setup_static_coupling(armature_obj, mw, rb_obj, bone) -> None:
     """STATIC: bone drives rigid body via bone parenting."""
     from mathutils import Matrix
 
     rb_obj.parent = armature_obj
     rb_obj.parent_type = "BONE"
-    rb_obj.parent_bone = bone_name
+    rb_obj.parent_bone = bone.name
 
     # Bone parenting origin is at the bone's TAIL, using the bone's rest matrix.
     # Parent transform = armature.matrix_world @ bone.matrix_local @ T(0, bone_length, 0)
-    bone = armature_obj.data.bones[bone_name]
-    parent_matrix = (
-        armature_obj.matrix_world
-        @ bone.matrix_local
-        @ Matrix.Translation((0, bone.length, 0))
-    )
+    parent_matrix = mw @ bone.matrix_local @ Matrix.Translation((0, bone.length, 0))
     rb_obj.matrix_parent_inverse = parent_matrix.inverted()
 
 
-def _setup_dynamic_coupling(armature_obj, rb_obj, bone_name: str, collection) -> tuple:
+def _setup_dynamic_coupling(mw, rb_obj, pb, collection) -> tuple:
     """DYNAMIC: physics drives bone via tracking empty + COPY_TRANSFORMS.
 
     Uses COPY_TRANSFORMS (location + rotation) — matching mmd_tools.
     DYNAMIC bodies need full transform from physics, not just rotation.
     Constraint is created muted; unmuted in post-build after reparenting.
     """
-    empty = _create_tracking_empty(armature_obj, bone_name, collection)
-    pb = armature_obj.pose.bones[bone_name]
+    empty = _create_tracking_empty(mw, pb, collection)
     c = pb.constraints.new("COPY_TRANSFORMS")
     c.name = "mmd_dynamic"
     c.target = empty
@@ -1728,13 +1867,12 @@ def _setup_dynamic_coupling(armature_obj, rb_obj, bone_name: str, collection) ->
     return (empty, rb_obj)
 
 
-def _setup_dynamic_bone_coupling(armature_obj, rb_obj, bone_name: str, collection) -> tuple:
+def _setup_dynamic_bone_coupling(mw, rb_obj, pb, collection) -> tuple:
     """DYNAMIC_BONE: physics drives bone rotation via tracking empty + COPY_ROTATION.
 
     Constraint is created muted; unmuted in post-build after reparenting.
     """
-    empty = _create_tracking_empty(armature_obj, bone_name, collection)
-    pb = armature_obj.pose.bones[bone_name]
+    empty = _create_tracking_empty(mw, pb, collection)
     c = pb.constraints.new("COPY_ROTATION")
     c.name = "mmd_dynamic_bone"
     c.target = empty
@@ -1742,8 +1880,22 @@ def _setup_dynamic_bone_coupling(armature_obj, rb_obj, bone_name: str, collectio
     return (empty, rb_obj)
 
 
-def _create_tracking_empty(armature_obj, bone_name: str, collection):
-    """Create an empty at the bone's world position.
+def _tracking_bone_name(empty) -> str | None:
+    """Return the bone a tracking empty follows, or None if it isn't one.
+
+    Empties from older builds only carry the name, so fall back to parsing
+    ``Track_<bone_name>``.
+    """
+    bone_name = empty.get("mmd_bone_name")
+    if bone_name is not None:
+        return bone_name
+    if empty.name.startswith("Track_"):
+        return empty.name[6:]
+    return None
+
+
+def _create_tracking_empty(mw, pb, collection):
+    """Create an empty at the pose bone's world position (``mw`` is the armature's).
 
     Sets matrix_world from bone pose. Parenting to the rigid body is
     deferred to _reparent_tracking_empties() (after depsgraph flush)
@@ -1751,14 +1903,14 @@ def _create_tracking_empty(armature_obj, bone_name: str, collection):
     """
     import bpy
 
+    bone_name = pb.name
     empty = bpy.data.objects.new(f"Track_{bone_name}", None)
+    empty["mmd_bone_name"] = bone_name
     empty.empty_display_size = 0.01
     empty.empty_display_type = "ARROWS"
     collection.objects.link(empty)
 
-    pb = armature_obj.pose.bones[bone_name]
-    bone_world = armature_obj.matrix_world @ pb.matrix
-    empty.matrix_world = bone_world
+    empty.matrix_world = mw @ pb.matrix
     return empty
 
 
@@ -1777,23 +1929,28 @@ def _mute_physics_ik_constraints(armature_obj, model, bone_names: dict, mute: bo
     if not armature_obj.pose:
         return {}
 
+    # Several bodies can share a bone; visit each bone once so the saved
+    # state is the user's, not the mute we just applied.
+    physics_bones = {
+        bone_names.get(rigid.bone_index)
+        for rigid in model.rigid_bodies
+        if rigid.mode in (RigidMode.DYNAMIC, RigidMode.DYNAMIC_BONE) and rigid.bone_index >= 0
+    }
+    physics_bones.discard(None)
+
     saved_state = {}
-    for rigid in model.rigid_bodies:
-        if rigid.mode not in (RigidMode.DYNAMIC, RigidMode.DYNAMIC_BONE):
-            continue
-        if rigid.bone_index < 0:
-            continue
-        bone_name = bone_names.get(rigid.bone_index)
-        if not bone_name or bone_name not in armature_obj.pose.bones:
+    pose_bones = armature_obj.pose.bones
+    for bone_name in physics_bones:
+        pb = pose_bones.get(bone_name)
+        if pb is None:
             continue
-
-        pb = armature_obj.pose.bones[bone_name]
         for c in pb.constraints:
             if c.type == "IK":
                 if mute:
-                    saved_state[(pb.name, c.name)] = c.mute
-                    c.mute = True
-                c.influence = c.influence  # trigger Blender update
+                    saved_state[(bone_name, c.name)] = c.mute
+                    c.mute = True  # mute's RNA update tags the depsgraph
+                else:
+                    c.influence = c.influence  # trigger Blender update
 
     log.debug("IK constraints %s for physics bones", "muted" if mute else "unmuted")
     return saved_state
@@ -1803,13 +1960,12 @@ def _restore_ik_mute_state(armature_obj, saved_state: dict) -> None:
     """Restore IK constraint mute state saved before physics build."""
     if not armature_obj.pose or not saved_state:
         return
-    for pb in armature_obj.pose.bones:
-        for c in pb.constraints:
-            if c.type == "IK":
-                key = (pb.name, c.name)
-                if key in saved_state:
-                    c.mute = saved_state[key]
-                    c.influence = c.influence  # trigger Blender update
+    pose_bones = armature_obj.pose.bones
+    for (bone_name, c_name), was_muted in saved_state.items():
+        pb = pose_bones.get(bone_name)
+        c = pb.constraints.get(c_name) if pb is not None else None
+        if c is not None:
+            c.mute = was_muted
 
 
 def _reparent_tracking_empties(empty_parent_map: dict) -> None:
@@ -1828,18 +1984,25 @@ def _reparent_tracking_empties(empty_parent_map: dict) -> None:
     log.debug("Reparented %d tracking empties to rigid bodies", len(empty_parent_map))
 
 
-def _unmute_tracking_constraints(armature_obj) -> None:
-    """Unmute mmd_dynamic / mmd_dynamic_bone constraints on pose bones.
+def _unmute_tracking_constraints(armature_obj, tracked_bones: list[str]) -> None:
+    """Unmute mmd_dynamic / mmd_dynamic_bone constraints on the coupled bones.
 
     Called in post-build after tracking empties are reparented and depsgraph
-    has flushed. Matches mmd_tools' __postBuild unmuting pattern.
+    has flushed. Matches mmd_tools' __postBuild unmuting pattern. Only the
+    bones coupled in this build carry the constraints, so they are looked up
+    by name instead of scanning every constraint on the rig.
     """
     if not armature_obj.pose:
         return
 
-    for pb in armature_obj.pose.bones:
-        for c in pb.constraints:
-            if c.name in ("mmd_dynamic", "mmd_dynamic_bone"):
+    pose_bones = armature_obj.pose.bones
+    for bone_name in tracked_bones:
+        pb = pose_bones.get(bone_name)
+        if pb is None:
+            continue
+        for name in _TRACKING_CONSTRAINT_NAMES:
+            c = pb.constraints.get(name)
+            if c is not None:
                 c.mute = False
 
     log.debug("Unmuted tracking constraints")
@@ -1878,7 +2041,9 @@ def _set_rigid_body_world_enabled(scene, enable: bool) -> bool:
     if rbw is None:
         return True  # default: enabled
     was_enabled = rbw.enabled
-    rbw.enabled = enable
+    # Every write resets the point cache, even when the value is unchanged
+    if was_enabled != enable:
+        rbw.enabled = enable
     return was_enabled
 
 
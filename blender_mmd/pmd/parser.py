@@ -12,6 +12,7 @@ Coordinate conversion (MMD left-handed Y-up → Blender right-handed Z-up):
 
 from __future__ import annotations
 
+import io
 import logging
 import math
 import struct
@@ -829,7 +830,9 @@ def parse(filepath: str | Path) -> Model:
     filepath = Path(filepath)
     log.info("Parsing PMD: %s", filepath.name)
 
-    with open(filepath, "rb") as f:
+    # One read up front; _Reader then slices from memory instead of going
+    # through the buffered file object for every primitive.
+    with io.BytesIO(filepath.read_bytes()) as f:
         r = _Reader(f)
 
         # Header
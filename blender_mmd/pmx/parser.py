@@ -11,6 +11,7 @@ Coordinate conversion (MMD left-handed Y-up → Blender right-handed Z-up):
 
 from __future__ import annotations
 
+import io
 import logging
 import struct
 from pathlib import Path
@@ -616,7 +617,9 @@ def parse(filepath: str | Path) -> Model:
     filepath = Path(filepath)
     log.info("Parsing PMX: %s", filepath.name)
 
-    with open(filepath, "rb") as f:
+    # One read up front; _Reader then slices from memory instead of going
+    # through the buffered file object for every primitive.
+    with io.BytesIO(filepath.read_bytes()) as f:
         r = _Reader(f)
 
         header = _parse_header(r)
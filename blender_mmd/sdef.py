@@ -92,38 +92,35 @@ def _precompute_sdef_data(
     # Find which vertices are in the SDEF group and get their bone weights
     result = SDEFMeshData()
 
-    for vi in range(n_verts):
-        # Check if this vertex is in the mmd_sdef group
+    # Non-SDEF verts have zeroed C/R0 attributes: filter them in bulk so
+    # only real SDEF candidates pay for the per-vertex group walk below.
+    nonzero = (np.abs(c_data) > 1e-8).any(axis=1) | (np.abs(r0_data) > 1e-8).any(axis=1)
+    candidates = np.flatnonzero(nonzero).tolist()
+
+    vertices = mesh_data.vertices
+    vg_names = [vg.name for vg in vertex_groups]
+
+    for vi in candidates:
+        # Single pass over the vertex's groups: SDEF membership + bone weights
         in_sdef = False
-        for g in mesh_data.vertices[vi].groups:
-            if g.group == sdef_group_index:
+        weights = []
+        for g in vertices[vi].groups:
+            gi = g.group
+            if gi == sdef_group_index:
                 in_sdef = True
-                break
+                continue
+            name = vg_names[gi]
+            if name.startswith("mmd_"):
+                continue
+            weights.append((name, g.weight, gi))
         if not in_sdef:
             continue
 
-        # Check that C is not zero (non-SDEF verts have zeroed attributes)
         C = c_data[vi]
-        if np.allclose(C, 0.0) and np.allclose(r0_data[vi], 0.0):
-            continue
-
         R0 = r0_data[vi]
         R1 = r1_data[vi]
         vertex_co = co_data[vi]
 
-        # Find the two bone weights for this vertex
-        bone0_name = None
-        bone1_name = None
-        w0 = 0.0
-        weights = []
-        for g in mesh_data.vertices[vi].groups:
-            if g.group == sdef_group_index:
-                continue
-            vg = vertex_groups[g.group]
-            if vg.name.startswith("mmd_"):
-                continue
-            weights.append((vg.name, g.weight, g.group))
-
         # Sort by vertex group index ascending (matches mmd_tools).
         # PMX R0 corresponds to bone1, R1 to bone2 — preserving
         # PMX bone order ensures R0/R1 map to the correct bones.
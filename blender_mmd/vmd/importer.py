@@ -17,12 +17,18 @@ import unicodedata
 from collections import defaultdict
 
 import bpy
-from mathutils import Matrix, Quaternion, Vector
+import numpy as np
+from mathutils import Matrix
 
 from .types import BoneKeyframe, MorphKeyframe, PropertyKeyframe, VmdMotion
 
 log = logging.getLogger("blender_mmd")
 
+# KeyframePoint.interpolation enum values, for bulk foreach_set writes
+_INTERP_LINEAR = 1
+_INTERP_BEZIER = 2
+
+
 # Morph fallback aliases: VMD morph name → list of alternative Japanese names.
 # When a VMD references a morph the model doesn't have, try these alternatives.
 # Ordered by similarity — first match wins.
@@ -356,7 +362,7 @@ class _BoneConverter:
     Matches mmd_tools' BoneConverter class.
     """
 
-    __slots__ = ("_mat", "_scale", "_interp_helper")
+    __slots__ = ("_mat", "_loc_mat", "_rot_mat", "_scale", "_interp_helper")
 
     def __init__(self, pose_bone: bpy.types.PoseBone, scale: float) -> None:
         # Get bone's rest pose matrix (bone-local → armature space)
@@ -367,42 +373,50 @@ class _BoneConverter:
         self._mat = mat.transposed()
         self._scale = scale
         self._interp_helper = _InterpolationHelper(self._mat)
+        # Row-vector forms for batch conversion. Conjugating by the unit
+        # quaternion q_mat keeps w and rotates (x, y, z) by q_mat's matrix.
+        self._loc_mat = np.array(self._mat, dtype=np.float64).T
+        self._rot_mat = np.array(self._mat.to_quaternion().to_matrix(), dtype=np.float64).T
 
-    def convert_location(self, loc: tuple[float, float, float]) -> Vector:
-        """Convert VMD bone-local location to Blender bone-local location."""
-        return self._mat @ Vector(loc) * self._scale
+    def convert_locations(self, locs: np.ndarray) -> np.ndarray:
+        """Convert (n, 3) VMD bone-local locations to Blender bone-local locations."""
+        return locs @ self._loc_mat * self._scale
 
-    def convert_rotation(self, rot: tuple[float, float, float, float]) -> Quaternion:
-        """Convert VMD bone-local quaternion to Blender bone-local quaternion.
+    def convert_rotations(self, rots: np.ndarray) -> np.ndarray:
+        """Convert (n, 4) VMD quaternions to Blender bone-local quaternions.
 
-        VMD stores quaternion as (x, y, z, w).
-        The matrix conjugation handles both the axis remapping and handedness.
+        VMD stores quaternions as (x, y, z, w); the result is (w, x, y, z).
+        Equivalent to ``(q_mat @ q_mmd @ q_mat.conjugated()).normalized()``.
         """
-        qx, qy, qz, qw = rot
-        q_mmd = Quaternion((qw, qx, qy, qz))
-        q_mat = self._mat.to_quaternion()
-        return (q_mat @ q_mmd @ q_mat.conjugated()).normalized()
+        out = np.empty_like(rots)
+        out[:, 0] = rots[:, 3]
+        out[:, 1:] = rots[:, :3] @ self._rot_mat
+        norm = np.linalg.norm(out, axis=1, keepdims=True)
+        out /= np.where(norm > 0.0, norm, 1.0)
+        return out
 
     def convert_interpolation(self, interp_xyz: tuple[int, ...]) -> tuple[int, ...]:
         """Remap interpolation byte offsets for axis permutation."""
         return self._interp_helper.convert(interp_xyz)
 
 
-def _compatible_quaternion(prev_q: Quaternion, curr_q: Quaternion) -> Quaternion:
-    """Ensure adjacent quaternion keyframes don't have sign flips.
+def _compatible_quaternions(rots: np.ndarray) -> np.ndarray:
+    """Flip quaternion signs in place so adjacent keyframes don't jump.
 
     q and -q represent the same rotation, but Blender's NLERP interpolation
     treats them differently — interpolating between q and -q takes the long
-    path (spinning ~360° instead of staying still). This function picks the
-    sign that's closer to the previous quaternion.
+    path (spinning ~360° instead of staying still). Each key takes the sign
+    closer to the (already adjusted) previous key, i.e. it flips when the
+    dot product is negative; the running sign is a cumulative product.
 
     Matches mmd_tools' __minRotationDiff.
     """
-    t1 = ((prev_q.w - curr_q.w) ** 2 + (prev_q.x - curr_q.x) ** 2
-          + (prev_q.y - curr_q.y) ** 2 + (prev_q.z - curr_q.z) ** 2)
-    t2 = ((prev_q.w + curr_q.w) ** 2 + (prev_q.x + curr_q.x) ** 2
-          + (prev_q.y + curr_q.y) ** 2 + (prev_q.z + curr_q.z) ** 2)
-    return -curr_q if t2 < t1 else curr_q
+    if len(rots) < 2:
+        return rots
+    dots = np.einsum("ij,ij->i", rots[:-1], rots[1:])
+    signs = np.cumprod(np.where(dots < 0.0, -1.0, 1.0))
+    rots[1:] *= signs[:, None]
+    return rots
 
 
 def _is_static_bone(keyframes: list[BoneKeyframe]) -> bool:
@@ -451,40 +465,33 @@ def _apply_bone_keyframes(
 
     n = len(keyframes)
 
-    # Pre-allocate keyframe points
-    for fc in loc_fcs + rot_fcs:
-        fc.keyframe_points.add(n)
-
     # Build per-bone converter
     converter = _BoneConverter(pose_bone, scale)
 
-    # Fill keyframe data with quaternion sign compatibility
-    prev_rot = None
-    for ki, kf in enumerate(keyframes):
-        loc = converter.convert_location(kf.location)
-        rot = converter.convert_rotation(kf.rotation)
-        frame = float(kf.frame) * fps_scale
-
-        # Ensure quaternion sign consistency between adjacent keyframes
-        if prev_rot is not None:
-            rot = _compatible_quaternion(prev_rot, rot)
-        prev_rot = rot
-
-        # Location
-        for ci in range(3):
-            kp = loc_fcs[ci].keyframe_points[ki]
-            kp.co = (frame, loc[ci])
-            kp.interpolation = "BEZIER"
-
-        # Rotation (Blender quaternion order: W, X, Y, Z)
-        rot_vals = (rot.w, rot.x, rot.y, rot.z)
-        for ci in range(4):
-            kp = rot_fcs[ci].keyframe_points[ki]
-            kp.co = (frame, rot_vals[ci])
-            kp.interpolation = "BEZIER"
+    # Convert all keyframes at once, with quaternion sign compatibility
+    frames = np.fromiter((kf.frame for kf in keyframes), dtype=np.float64, count=n) * fps_scale
+    locs = converter.convert_locations(
+        np.array([kf.location for kf in keyframes], dtype=np.float64).reshape(n, 3)
+    )
+    # Blender quaternion order: W, X, Y, Z
+    rots = _compatible_quaternions(converter.convert_rotations(
+        np.array([kf.rotation for kf in keyframes], dtype=np.float64).reshape(n, 4)
+    ))
+
+    # Write all points per F-curve in bulk (appended after any existing keys)
+    loc_bases = [
+        _append_keyframes(fc, frames, locs[:, ci], _INTERP_BEZIER)
+        for ci, fc in enumerate(loc_fcs)
+    ]
+    rot_bases = [
+        _append_keyframes(fc, frames, rots[:, ci], _INTERP_BEZIER)
+        for ci, fc in enumerate(rot_fcs)
+    ]
 
     # Apply interpolation handles
-    _apply_bone_interpolation(loc_fcs, rot_fcs, keyframes, converter)
+    _apply_bone_interpolation(
+        loc_fcs, rot_fcs, keyframes, converter, loc_bases, rot_bases,
+    )
 
     # Fix first/last keyframe handles (matches mmd_tools __fixFcurveHandles)
     for fc in loc_fcs + rot_fcs:
@@ -503,6 +510,8 @@ def _apply_bone_interpolation(
     rot_fcs: list,
     keyframes: list[BoneKeyframe],
     converter: _BoneConverter,
+    loc_bases: list[int] | None = None,
+    rot_bases: list[int] | None = None,
 ) -> None:
     """Apply VMD Bézier interpolation curves to F-curve keyframe handles.
 
@@ -518,10 +527,15 @@ def _apply_bone_interpolation(
 
     The axis remapping uses the bone converter's interpolation helper to
     compute the correct row offsets for each axis (matches mmd_tools).
+
+    ``loc_bases``/``rot_bases`` give, per F-curve, the index of the first
+    keyframe point belonging to ``keyframes`` (non-zero when appending).
     """
     n = len(keyframes)
     if n < 2:
         return
+    loc_bases = loc_bases or [0] * len(loc_fcs)
+    rot_bases = rot_bases or [0] * len(rot_fcs)
 
     # Compute axis-remapped interpolation byte offsets for location channels
     # (0, 16, 32) are the row start offsets for X, Y, Z in the 64-byte block
@@ -540,8 +554,9 @@ def _apply_bone_interpolation(
             y1 = interp[idx + 4]
             x2 = interp[idx + 8]
             y2 = interp[idx + 12]
+            b = loc_bases[bl_axis]
             _set_bezier_handles(
-                loc_fcs[bl_axis], ki, ki + 1, x1, y1, x2, y2
+                loc_fcs[bl_axis], b + ki, b + ki + 1, x1, y1, x2, y2
             )
 
         # Rotation channel (all 4 quaternion components share the same curve)
@@ -549,8 +564,41 @@ def _apply_bone_interpolation(
         y1 = interp[rot_index + 4]
         x2 = interp[rot_index + 8]
         y2 = interp[rot_index + 12]
-        for fc in rot_fcs:
-            _set_bezier_handles(fc, ki, ki + 1, x1, y1, x2, y2)
+        for fc, b in zip(rot_fcs, rot_bases):
+            _set_bezier_handles(fc, b + ki, b + ki + 1, x1, y1, x2, y2)
+
+
+def _append_keyframes(fc, frames: np.ndarray, values: np.ndarray, interpolation: int) -> int:
+    """Append keyframe points to an F-curve with bulk co/interpolation writes.
+
+    Existing keys on a frame that ``frames`` also sets are removed first, so
+    a layered VMD replaces them instead of leaving two keys on one frame.
+    Returns the index of the first appended point.
+    """
+    kps = fc.keyframe_points
+    base = len(kps)
+    n = len(frames)
+    if base:
+        old_co = np.empty(base * 2, dtype=np.float32)
+        kps.foreach_get("co", old_co)
+        overlap = np.flatnonzero(np.isin(old_co[0::2], np.asarray(frames, dtype=np.float32)))
+        for i in overlap[::-1].tolist():
+            kps.remove(kps[i], fast=True)
+        base -= len(overlap)
+    kps.add(n)
+
+    co = np.empty((base + n) * 2, dtype=np.float32)
+    interp = np.empty(base + n, dtype=np.int32)
+    if base:
+        kps.foreach_get("co", co)
+        kps.foreach_get("interpolation", interp)
+    co = co.reshape(-1, 2)
+    co[base:, 0] = frames
+    co[base:, 1] = values
+    interp[base:] = interpolation
+    kps.foreach_set("co", co.ravel())
+    kps.foreach_set("interpolation", interp)
+    return base
 
 
 def _set_bezier_handles(
@@ -687,13 +735,9 @@ def _apply_morph_keyframes(
             shape_keys, data_path, index=0, group_name=sk_name
         )
 
-        n = len(keyframes)
-        fc.keyframe_points.add(n)
-
-        for ki, kf in enumerate(keyframes):
-            kp = fc.keyframe_points[ki]
-            kp.co = (float(kf.frame) * fps_scale, kf.weight)
-            kp.interpolation = "LINEAR"
+        frames = np.fromiter((kf.frame for kf in keyframes), dtype=np.float32, count=len(keyframes))
+        weights = np.fromiter((kf.weight for kf in keyframes), dtype=np.float32, count=len(keyframes))
+        _append_keyframes(fc, frames * fps_scale, weights, _INTERP_LINEAR)
 
         fc.update()
         applied += 1
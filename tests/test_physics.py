@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import math
 from pathlib import Path
 
 import pytest
@@ -17,6 +18,7 @@ from blender_mmd.physics import (
     _build_rigid_to_chain_map,
     _compute_ncc_pairs,
     _rigid_bounding_range,
+    _unit_capsule,
 )
 
 SAMPLES_DIR = Path(__file__).parent / "samples"
@@ -349,6 +351,99 @@ class TestProximityFilter:
         assert len(pairs) == 0
 
 
+# ---------------------------------------------------------------------------
+# Non-collision pair enumeration
+# ---------------------------------------------------------------------------
+
+def _ncc_rb(group: int, mask: int = 0xFFFF) -> dict:
+    return {"collision_group_number": group, "collision_group_mask": mask,
+            "size": [1, 1, 1], "shape": 0}
+
+
+def _pair_indices(pairs: list[tuple], rigid_objects: list) -> list[tuple[int, int]]:
+    index = {id(obj): i for i, obj in enumerate(rigid_objects)}
+    return [(index[id(a)], index[id(b)]) for a, b in pairs]
+
+
+class TestNccPairs:
+    def test_one_report_per_unordered_pair(self):
+        """Mutually excluding bodies produce each unordered pair exactly once."""
+        rb_data = [_ncc_rb(1, 0xFFFD) for _ in range(5)]
+        rigid_objects = [_FakeObj(i, 0, 0) for i in range(5)]
+
+        pairs = _pair_indices(
+            _compute_ncc_pairs(rb_data, [], rigid_objects), rigid_objects,
+        )
+        assert len(pairs) == 10
+        assert len({frozenset(p) for p in pairs}) == 10
+        assert all(i < j for i, j in pairs)
+
+    def test_order_by_row_group_col(self):
+        """Pairs come out by reporting body, then partner group, then partner index."""
+        rb_data = [
+            _ncc_rb(0, 0xFFF9),  # excludes groups 1 and 2
+            _ncc_rb(2),
+            _ncc_rb(1),
+            _ncc_rb(2, 0xFFFC),  # excludes groups 0 and 1
+            _ncc_rb(1),
+        ]
+        rigid_objects = [_FakeObj() for _ in rb_data]
+
+        pairs = _pair_indices(
+            _compute_ncc_pairs(rb_data, [], rigid_objects), rigid_objects,
+        )
+        # Body 3's exclusion of body 0 was already reported by body 0
+        assert pairs == [(0, 2), (0, 4), (0, 1), (0, 3), (3, 2), (3, 4)]
+
+    def test_groups_outside_range_ignored(self):
+        """Bodies with a collision group outside 0-15 are never excluded."""
+        rb_data = [_ncc_rb(1, 0), _ncc_rb(16), _ncc_rb(-1), _ncc_rb(1)]
+        rigid_objects = [_FakeObj() for _ in rb_data]
+
+        pairs = _pair_indices(
+            _compute_ncc_pairs(rb_data, [], rigid_objects), rigid_objects,
+        )
+        assert pairs == [(0, 3)]
+
+    def test_none_objects_skipped(self):
+        """Pairs involving a missing (None) object are dropped."""
+        rb_data = [_ncc_rb(1, 0xFFFD) for _ in range(3)]
+        rigid_objects = [_FakeObj(), None, _FakeObj()]
+
+        pairs = _compute_ncc_pairs(rb_data, [], rigid_objects)
+        assert pairs == [(rigid_objects[0], rigid_objects[2])]
+
+    def test_objects_without_location_skip_proximity(self):
+        """Objects without a location bypass the proximity filter."""
+
+        class _NoLocation:
+            pass
+
+        rb_data = [_ncc_rb(1, 0xFFFD) for _ in range(3)]
+        rigid_objects = [_FakeObj(0, 0, 0), _FakeObj(100, 0, 0), _NoLocation()]
+
+        pairs = _pair_indices(
+            _compute_ncc_pairs(rb_data, [], rigid_objects, ncc_proximity=1.5),
+            rigid_objects,
+        )
+        assert pairs == [(0, 2), (1, 2)]
+
+    def test_jointed_pairs_excluded_in_both_orders(self):
+        """Joint-connected pairs in range get no NCC, whichever way round the joint is."""
+        rb_data = [_ncc_rb(1, 0xFFFD) for _ in range(4)]
+        rigid_objects = [_FakeObj(0.1 * i, 0, 0) for i in range(4)]
+        joints_data = [
+            {"src_rigid": 0, "dest_rigid": 1},
+            {"src_rigid": 3, "dest_rigid": 2},
+        ]
+
+        pairs = _pair_indices(
+            _compute_ncc_pairs(rb_data, joints_data, rigid_objects, ncc_proximity=1.5),
+            rigid_objects,
+        )
+        assert pairs == [(0, 2), (0, 3), (1, 2), (1, 3)]
+
+
 # ---------------------------------------------------------------------------
 # Bounding range helper
 # ---------------------------------------------------------------------------
@@ -380,3 +475,54 @@ class TestRigidBoundingRange:
         """Unknown shape returns small default."""
         rb = {"size": [1, 1, 1], "shape": 99}
         assert _rigid_bounding_range(rb) == 0.01
+
+
+# ---------------------------------------------------------------------------
+# Capsule mesh template
+# ---------------------------------------------------------------------------
+
+def _closed_form_capsule(radius: float, height: float, segments: int, rings: int) -> list:
+    """Capsule vertices as the original per-vertex bmesh builder placed them."""
+    half_h = height / 2.0
+    verts = [(0, 0, half_h + radius)]
+    for i in range(rings, 0, -1):
+        z = radius * math.sin(0.5 * math.pi * i / rings)
+        r = math.sqrt(radius ** 2 - z ** 2)
+        for j in range(segments):
+            theta = 2 * math.pi * j / segments
+            verts.append((r * math.cos(theta), r * math.sin(theta), z + half_h))
+    for i in range(rings):
+        z = -radius * math.sin(0.5 * math.pi * i / rings)
+        r = math.sqrt(radius ** 2 - z ** 2)
+        for j in range(segments):
+            theta = 2 * math.pi * j / segments
+            verts.append((r * math.cos(theta), r * math.sin(theta), z - half_h))
+    verts.append((0, 0, -(half_h + radius)))
+    return verts
+
+
+class TestCapsuleTemplate:
+    @pytest.mark.parametrize("segments,rings", [(8, 3), (6, 2), (12, 4)])
+    def test_vertices_match_closed_form(self, segments, rings):
+        """Scaled template vertices match the closed-form capsule."""
+        radius, height = 0.35, 1.2
+        unit_verts, _faces = _unit_capsule(segments, rings)
+        half_h = height / 2.0
+        scaled = [
+            (x * radius, y * radius, z * radius + side * half_h)
+            for x, y, z, side in unit_verts
+        ]
+        expected = _closed_form_capsule(radius, height, segments, rings)
+        assert len(scaled) == len(expected)
+        for got, want in zip(scaled, expected):
+            assert got == pytest.approx(want, abs=1e-9)
+
+    def test_face_indices_in_range(self):
+        """Two fans plus (2 * rings - 1) quad bands, all indexing template vertices."""
+        segments, rings = 8, 3
+        unit_verts, faces = _unit_capsule(segments, rings)
+        assert len(faces) == 2 * segments + (2 * rings - 1) * segments
+        assert all(0 <= i < len(unit_verts) for face in faces for i in face)
+
+    def test_template_is_cached(self):
+        assert _unit_capsule(8, 3) is _unit_capsule(8, 3)
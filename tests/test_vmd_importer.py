@@ -0,0 +1,83 @@
+"""VMD importer tests — F-curve keyframe writes without Blender."""
+
+from __future__ import annotations
+
+import sys
+from unittest.mock import MagicMock
+
+import numpy as np
+
+# vmd/importer.py imports bpy/mathutils which aren't available outside Blender.
+# Mock them so we can exercise _append_keyframes against a fake F-curve.
+sys.modules.setdefault("bpy", MagicMock())
+sys.modules.setdefault("mathutils", MagicMock())
+
+from blender_mmd.vmd.importer import _INTERP_BEZIER, _INTERP_LINEAR, _append_keyframes
+
+
+class _FakeKeyframePoints:
+    """keyframe_points stand-in backed by numpy arrays (co + interpolation only)."""
+
+    def __init__(self):
+        self.co = np.zeros((0, 2), dtype=np.float32)
+        self.interpolation = np.zeros(0, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.co)
+
+    def __getitem__(self, index):
+        return index
+
+    def add(self, count):
+        self.co = np.vstack([self.co, np.zeros((count, 2), dtype=np.float32)])
+        self.interpolation = np.concatenate([self.interpolation, np.zeros(count, dtype=np.int32)])
+
+    def remove(self, point, fast=False):
+        self.co = np.delete(self.co, point, axis=0)
+        self.interpolation = np.delete(self.interpolation, point)
+
+    def foreach_get(self, attr, buf):
+        buf[:] = getattr(self, attr).ravel()
+
+    def foreach_set(self, attr, buf):
+        current = getattr(self, attr)
+        setattr(self, attr, np.asarray(buf, dtype=current.dtype).reshape(current.shape))
+
+
+class _FakeFCurve:
+    def __init__(self):
+        self.keyframe_points = _FakeKeyframePoints()
+
+
+def _frames(values):
+    return np.asarray(values, dtype=np.float64)
+
+
+class TestAppendKeyframes:
+    def test_empty_curve(self):
+        fc = _FakeFCurve()
+        base = _append_keyframes(fc, _frames([0, 10]), np.array([1.0, 2.0]), _INTERP_BEZIER)
+        kps = fc.keyframe_points
+        assert base == 0
+        assert kps.co.tolist() == [[0, 1], [10, 2]]
+        assert kps.interpolation.tolist() == [_INTERP_BEZIER] * 2
+
+    def test_appends_after_existing_keys(self):
+        """Appending keeps existing keys and writes new ones after them."""
+        fc = _FakeFCurve()
+        _append_keyframes(fc, _frames([0, 10]), np.array([1.0, 2.0]), _INTERP_BEZIER)
+        base = _append_keyframes(fc, _frames([20, 30]), np.array([3.0, 4.0]), _INTERP_LINEAR)
+        kps = fc.keyframe_points
+        assert base == 2
+        assert kps.co.tolist() == [[0, 1], [10, 2], [20, 3], [30, 4]]
+        assert kps.interpolation.tolist() == [_INTERP_BEZIER] * 2 + [_INTERP_LINEAR] * 2
+
+    def test_overlapping_frames_replaced(self):
+        """A frame keyed by both motions ends up with one key: the new one."""
+        fc = _FakeFCurve()
+        _append_keyframes(fc, _frames([0, 10, 20]), np.array([1.0, 2.0, 3.0]), _INTERP_BEZIER)
+        base = _append_keyframes(fc, _frames([10, 40]), np.array([9.0, 8.0]), _INTERP_BEZIER)
+        kps = fc.keyframe_points
+        assert base == 2
+        assert kps.co.tolist() == [[0, 1], [20, 3], [10, 9], [40, 8]]
+        assert len(set(kps.co[:, 0].tolist())) == len(kps)